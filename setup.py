@@ -16,6 +16,7 @@ install_requires = [
     "matplotlib",
     "networkx>=2.2",
     "numpy",
+    "openpyxl",
     "pandas>=1.0",
     "pyarrow>=0.16",
     "pyyaml",
@@ -55,6 +55,14 @@ def parse_command_line(argv):
         will fail. Either the datapkg_bundle_name in the settings_file needs to
         be unique or you need to include --clobber""",
         default=False)
+    parser.add_argument(
+        '-p',
+        '--parallel',
+        action='store_true',
+        help="""Process the datasets within each datapackage in parallel, in
+        separate processes. This is faster, but needs enough memory for all of
+        the datasets at once, rather than just the largest of them.""",
+        default=False)
     arguments = parser.parse_args(argv[1:])
     return arguments
 
@@ -81,6 +89,11 @@ def main():
 
     pudl_settings = pudl.workspace.setup.derive_paths(
         pudl_in=pudl_in, pudl_out=pudl_out)
+    # Optional caches of the raw spreadsheets and transformed DataFrames, for
+    # reuse between runs.
+    for cache_dir in ("excel_cache_dir", "transform_cache_dir"):
+        if script_settings.get(cache_dir):
+            pudl_settings[cache_dir] = script_settings[cache_dir]
 
     logger.info('verifying that the data we need exists in the data store')
     flattened_params_dict = pudl.etl.get_flattened_etl_parameters(
@@ -110,7 +123,8 @@ def main():
         pudl_settings,
         datapkg_bundle_name=script_settings['datapkg_bundle_name'],
         datapkg_bundle_doi=datapkg_bundle_doi,
-        clobber=args.clobber)
+        clobber=args.clobber,
+        parallel=args.parallel)
 
 
 if __name__ == "__main__":
@@ -7,10 +7,45 @@ data cleaning purposes.
 """
 
 import importlib.resources
+import re
 
 import pandas as pd
 import sqlalchemy as sa
 
+
+def _invert_str_map(str_map):
+    """Invert a string map for direct lookups of the strings to be replaced.
+
+    The string maps below are dictionaries of lists of strings, in which the
+    keys are the canonical strings with which each string found in the
+    corresponding list is replaced. :func:`pudl.helpers.cleanstrings` uses the
+    inverted maps, which are built once here, rather than every time a column
+    is cleaned up.
+
+    The strings to be replaced are simplified the same way that cleanstrings
+    simplifies the strings it looks up: stripped, lowercased, and with their
+    whitespace compacted. The canonical strings are mapped to themselves, so
+    that they're left alone.
+
+    Args:
+        str_map (dict): A dictionary of lists of strings, in which the keys
+            are the canonical strings.
+
+    Returns:
+        dict: A dictionary whose keys are the strings to be replaced, and whose
+        values are the canonical strings to replace them with.
+
+    """
+    inverse_map = {}
+    for canonical, strings in str_map.items():
+        for s in strings:
+            inverse_map.setdefault(
+                re.sub(r'\s+', ' ', s.lower().strip()), canonical)
+    for canonical in str_map:
+        inverse_map.setdefault(canonical, canonical)
+    return inverse_map
+
+
 ######################################################################
 # Constants used within the init.py module.
 ######################################################################
@@ -329,6 +364,8 @@ ferc1_fuel_strings = {"coal": ferc1_coal_strings,
 """dict: A dictionary linking fuel types (keys) to lists of various strings
     representing that fuel (values)
 """
+ferc1_fuel_strings_inverse = _invert_str_map(ferc1_fuel_strings)
+
 # Similarly, dictionary for cleaning up fuel unit strings
 ferc1_ton_strings = ['toms', 'taons', 'tones', 'col-tons', 'toncoaleq', 'coal',
                      'tons coal eq', 'coal-tons', 'ton', 'tons', 'tons coal',
@@ -413,6 +450,7 @@ ferc1_fuel_unit_strings = {'ton': ferc1_ton_strings,
 dict: A dictionary linking fuel units (keys) to lists of various strings
     representing those fuel units (values)
 """
+ferc1_fuel_unit_strings_inverse = _invert_str_map(ferc1_fuel_unit_strings)
 
 # Categorizing the strings from the FERC Form 1 Plant Kind (plant_kind) field
 # into lists. There are many strings that weren't categorized,
@@ -574,6 +612,7 @@ ferc1_plant_kind_strings = {
 dict: A dictionary of plant kinds (keys) and associated lists of plant_fuel
     strings (values).
 """
+ferc1_plant_kind_strings_inverse = _invert_str_map(ferc1_plant_kind_strings)
 
 # This is an alternative set of strings for simplifying the plant kind field
 # from Uday & Laura at CPI. For the moment we have reverted to using our own
@@ -779,6 +818,7 @@ ferc1_const_type_strings = {
 """dict: A dictionary of construction types (keys) and lists of construction
     type strings associated with each type (values) from FERC Form 1.
 """
+ferc1_const_type_strings_inverse = _invert_str_map(ferc1_const_type_strings)
 
 ferc1_power_purchase_type = {
     'RQ': 'requirement',
@@ -1511,6 +1551,8 @@ fuel_type_eia923_gen_fuel_simple_map = {
 """dict: A dictionary mapping EIA 923 Generation Fuel fuel types (keys) to lists
     of strings associated with that fuel type (values).
 """
+fuel_type_eia923_gen_fuel_simple_map_inverse = _invert_str_map(
+    fuel_type_eia923_gen_fuel_simple_map)
 
 # Fuel type strings for EIA 923 boiler fuel table
 
@@ -1549,6 +1591,8 @@ fuel_type_eia923_boiler_fuel_simple_map = {
 """dict: A dictionary mapping EIA 923 Boiler Fuel fuel types (keys) to lists
     of strings associated with that fuel type (values).
 """
+fuel_type_eia923_boiler_fuel_simple_map_inverse = _invert_str_map(
+    fuel_type_eia923_boiler_fuel_simple_map)
 
 # PUDL consolidation of EIA923 AER fuel type strings into same categories as
 # 'energy_source_eia923' plus additional renewable and nuclear categories.
@@ -1693,6 +1737,8 @@ fuel_type_eia860_simple_map = {
 """dict: A dictionary mapping EIA 860 fuel types (keys) to lists
     of strings associated with that fuel type (values).
 """
+fuel_type_eia860_simple_map_inverse = _invert_str_map(
+    fuel_type_eia860_simple_map)
 
 # EIA 923/860: Lumping of energy source categories.
 energy_source_eia_simple_map = {
@@ -1708,6 +1754,8 @@ energy_source_eia_simple_map = {
 }
 """dict: A dictionary mapping EIA fuel types (keys) to fuel codes (values).
 """
+energy_source_eia_simple_map_inverse = _invert_str_map(
+    energy_source_eia_simple_map)
 
 fuel_group_eia923_simple_map = {
     'coal': ['coal', 'petroleum coke'],
@@ -1717,6 +1765,17 @@ fuel_group_eia923_simple_map = {
 """dict: A dictionary mapping EIA 923 simple fuel types("oil", "coal", "gas")
     (keys) to fuel types (values).
 """
+fuel_group_eia923_simple_map_inverse = _invert_str_map(
+    fuel_group_eia923_simple_map)
+
+# Natural gas transportation and delivery contracts in the EIA 923 fuel
+# receipts and costs table are either firm or interruptible.
+natural_gas_contract_eia923_strings = {
+    'firm': ['F'],
+    'interruptible': ['I'],
+}
+natural_gas_contract_eia923_strings_inverse = _invert_str_map(
+    natural_gas_contract_eia923_strings)
 
 # EIA 923: The type of physical units fuel consumption is reported in.
 # All consumption is reported in either short tons for solids,
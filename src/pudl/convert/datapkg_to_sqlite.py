@@ -55,15 +55,15 @@ def datapkg_to_sqlite(sqlite_url, out_path, clobber=False):
 
     """
     # prepping the sqlite engine
-    pudl_engine = sa.create_engine(sqlite_url)
+    pudl_engine = pudl.helpers.create_bulk_load_engine(sqlite_url)
     logger.info("Dropping the current PUDL DB, if it exists.")
     try:
         # So that we can wipe it out
         pudl.helpers.drop_tables(pudl_engine, clobber=clobber)
     except sa.exc.OperationalError:
         pass
-    # And start anew
-    pudl_engine = sa.create_engine(sqlite_url)
+    # And start anew, without any connections left over from the old DB
+    pudl_engine.dispose()
 
     # grab the merged datapackage metadata file:
     pkg = datapackage.DataPackage(
@@ -44,6 +44,13 @@ def parse_command_line(argv):
         not included but the sqlite databse already exists the _build will
         fail.""",
         default=False)
+    parser.add_argument(
+        '-p',
+        '--parallel',
+        action='store_true',
+        help="""Parse the DBF files for each year in parallel, in separate
+        processes. This is faster, but needs more memory.""",
+        default=False)
     arguments = parser.parse_args(argv[1:])
     return arguments
 
@@ -116,7 +123,8 @@ def main():  # noqa: C901
         refyear=script_settings['ferc1_to_sqlite_refyear'],
         pudl_settings=pudl_settings,
         bad_cols=bad_cols,
-        clobber=args.clobber)
+        clobber=args.clobber,
+        parallel=args.parallel)
 
 
 if __name__ == '__main__':
@@ -17,12 +17,19 @@ data from:
 
 """
 
+import concurrent.futures
+import functools
+import hashlib
+import json
 import logging
+import os
 import pathlib
+import shutil
 import time
 import uuid
 
 import pandas as pd
+import pyarrow as pa
 
 import pudl
 import pudl.constants as pc
@@ -49,6 +56,99 @@ def _validate_params_partition(etl_params_og, tables):
     return(partition_dict)
 
 
+@functools.lru_cache(maxsize=None)
+def _code_digest():
+    """Hash the source code and packaged data of the whole pudl package.
+
+    The extract and transform steps also depend on :mod:`pudl.helpers`,
+    :mod:`pudl.constants` and the files in ``package_data``, so every file in
+    the package is included, not just the extract and transform modules.
+
+    Returns:
+        str: A hexadecimal digest of the package's contents.
+
+    """
+    sha = hashlib.sha1()
+    pkg_dir = pathlib.Path(pudl.__file__).parent
+    for path in sorted(pkg_dir.rglob("*")):
+        if path.is_file() and "__pycache__" not in path.parts:
+            sha.update(path.relative_to(pkg_dir).as_posix().encode())
+            sha.update(path.read_bytes())
+    return sha.hexdigest()
+
+
+def _transform_cache_key(*args):
+    """Hash ETL step inputs together with the pudl package's code and data.
+
+    Any edit to the pudl package yields a new key, so cached outputs never
+    outlive the code that made them.
+
+    Args:
+        args: The (repr-able) inputs to the ETL step, e.g. tables and years.
+
+    Returns:
+        str: A hexadecimal digest identifying this step's outputs.
+
+    """
+    sha = hashlib.sha1(repr(args).encode())
+    sha.update(_code_digest().encode())
+    return sha.hexdigest()
+
+
+def _cached_dfs(pudl_settings, name, func, *args):
+    """Run an extract and transform step, or reuse its cached output.
+
+    If ``pudl_settings`` contains a ``transform_cache_dir``, the dictionary of
+    DataFrames returned by ``func(*args)`` is stored there as one Parquet file
+    per table, keyed by :func:`_transform_cache_key`. Later runs with the same
+    inputs and code read the Parquet files back instead of re-running the
+    step. Without a ``transform_cache_dir`` the step always runs. Changes to
+    the raw input data are not tracked, so clear the cache after updating the
+    datastore.
+
+    Args:
+        pudl_settings (dict): a dictionary filled with settings that mostly
+            describe paths to various resources and outputs.
+        name (str): Name of the ETL step, used to group its cached outputs.
+        func (callable): Function returning a dictionary of table names (keys)
+            and DataFrames (values).
+        args: Positional arguments for ``func``.
+
+    Returns:
+        dict: A dictionary of table names (keys) and DataFrames (values).
+
+    """
+    cache_root = pudl_settings.get("transform_cache_dir")
+    if not cache_root:
+        return func(*args)
+
+    cache_dir = pathlib.Path(cache_root, name, _transform_cache_key(*args))
+    if cache_dir.is_dir():
+        logger.info(f"Reading cached {name} DataFrames from {cache_dir}")
+        tables = json.loads((cache_dir / "tables.json").read_text())
+        return {
+            table: pd.read_parquet(cache_dir / f"{table}.parquet")
+            for table in tables
+        }
+
+    dfs = func(*args)
+    # Write to a scratch directory and rename it into place, so that an
+    # interrupted run never leaves behind a partial cache entry.
+    tmp_dir = cache_dir.with_suffix(".tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+    try:
+        for table, df in dfs.items():
+            df.to_parquet(tmp_dir / f"{table}.parquet")
+        # Record the order of the tables, to return them in the same order.
+        (tmp_dir / "tables.json").write_text(json.dumps(list(dfs)))
+        tmp_dir.rename(cache_dir)
+    except (pa.ArrowException, ValueError, OSError) as err:
+        logger.warning(f"Not caching {name} DataFrames: {err}")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return dfs
+
+
 ###############################################################################
 # EIA EXPORT FUNCTIONS
 ###############################################################################
@@ -94,27 +194,33 @@ def _validate_params_eia(etl_params):  # noqa: C901
         eia_input_dict['eia860_years'] = eia_input_dict['eia923_years']
 
     # Validate the etl_params
-    if eia_input_dict['eia860_tables']:
-        for table in eia_input_dict['eia860_tables']:
-            if table not in pc.pudl_tables["eia860"]:
-                raise AssertionError(
-                    f"Unrecognized EIA 860 table: {table}"
-                )
-
-    if eia_input_dict['eia923_tables']:
-        for table in eia_input_dict['eia923_tables']:
-            if table not in pc.pudl_tables["eia923"]:
-                raise AssertionError(
-                    f"Unrecogized EIA 923 table: {table}"
-                )
-
-    for year in eia_input_dict['eia860_years']:
-        if year not in pc.working_years['eia860']:
-            raise AssertionError(f"Unrecognized EIA 860 year: {year}")
-
-    for year in eia_input_dict['eia923_years']:
-        if year not in pc.working_years['eia923']:
-            raise AssertionError(f"Unrecognized EIA 923 year: {year}")
+    bad_tables = (set(eia_input_dict['eia860_tables'] or ())
+                  - set(pc.pudl_tables["eia860"]))
+    if bad_tables:
+        raise AssertionError(
+            f"Unrecognized EIA 860 tables: {sorted(bad_tables)}"
+        )
+
+    bad_tables = (set(eia_input_dict['eia923_tables'] or ())
+                  - set(pc.pudl_tables["eia923"]))
+    if bad_tables:
+        raise AssertionError(
+            f"Unrecognized EIA 923 tables: {sorted(bad_tables)}"
+        )
+
+    bad_years = (set(eia_input_dict['eia860_years'])
+                 - set(pc.working_years['eia860']))
+    if bad_years:
+        raise AssertionError(
+            f"Unrecognized EIA 860 years: {sorted(bad_years)}"
+        )
+
+    bad_years = (set(eia_input_dict['eia923_years'])
+                 - set(pc.working_years['eia923']))
+    if bad_years:
+        raise AssertionError(
+            f"Unrecognized EIA 923 years: {sorted(bad_years)}"
+        )
     if not eia_input_dict['eia923_years'] and not eia_input_dict['eia860_years']:
         return None
     else:
@@ -170,6 +276,60 @@ def _load_static_tables_eia(datapkg_dir):
     return list(static_dfs.keys())
 
 
+def _transform_eia(eia923_tables, eia923_years,
+                   eia860_tables, eia860_years, data_dir,
+                   excel_cache_dir=None):
+    """Extract and transform the EIA 923 and 860 data.
+
+    Args:
+        eia923_tables (list): EIA 923 tables to transform.
+        eia923_years (list): Years of EIA 923 data to extract.
+        eia860_tables (list): EIA 860 tables to transform.
+        eia860_years (list): Years of EIA 860 data to extract.
+        data_dir (path-like): Path to the top directory of the PUDL datastore.
+        excel_cache_dir (path-like): Optional directory in which to cache the
+            pages read from the EIA spreadsheets.
+
+    Returns:
+        dict: The transformed EIA DataFrames, followed by the harvested EIA
+        entity DataFrames, keyed by table name.
+
+    """
+    # The EIA 860 spreadsheets are read in the background, while the EIA 923
+    # data is extracted and transformed, rather than only once it's done.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        eia860_future = executor.submit(
+            pudl.extract.eia860.Extractor(
+                data_dir, cache_dir=excel_cache_dir).extract,
+            eia860_years, tables=eia860_tables)
+        eia923_raw_dfs = pudl.extract.eia923.Extractor(
+            data_dir, cache_dir=excel_cache_dir).extract(
+                eia923_years, tables=eia923_tables)
+        eia923_transformed_dfs = pudl.transform.eia923.transform(
+            eia923_raw_dfs, eia923_tables=eia923_tables)
+        del eia923_raw_dfs
+        eia860_raw_dfs = eia860_future.result()
+    eia860_transformed_dfs = pudl.transform.eia860.transform(
+        eia860_raw_dfs, eia860_tables=eia860_tables)
+    del eia860_raw_dfs
+    # create an eia transformed dfs dictionary
+    eia_transformed_dfs = eia860_transformed_dfs.copy()
+    eia_transformed_dfs.update(eia923_transformed_dfs.copy())
+    # convert types..
+    eia_transformed_dfs = pudl.helpers.convert_dfs_dict_dtypes(
+        eia_transformed_dfs, 'eia')
+
+    entities_dfs, eia_transformed_dfs = pudl.transform.eia.transform(
+        eia_transformed_dfs,
+        eia923_years=eia923_years,
+        eia860_years=eia860_years
+    )
+    # convert types..
+    entities_dfs = pudl.helpers.convert_dfs_dict_dtypes(entities_dfs, 'eia')
+
+    return {**eia_transformed_dfs, **entities_dfs}
+
+
 def _etl_eia(etl_params, datapkg_dir, pudl_settings):
     """
     Extracts, transforms and loads CSVs for the EIA datasets.
@@ -200,41 +360,15 @@ def _etl_eia(etl_params, datapkg_dir, pudl_settings):
     # generate CSVs for the static EIA tables, return the list of tables
     static_tables = _load_static_tables_eia(datapkg_dir)
 
-    # Extract EIA forms 923, 860
-    data_dir = pudl_settings["data_dir"]
-    eia923_raw_dfs = pudl.extract.eia923.Extractor(
-        data_dir).extract(eia923_years)
-    eia860_raw_dfs = pudl.extract.eia860.Extractor(
-        data_dir).extract(eia860_years)
-    # Transform EIA forms 923, 860
-    eia923_transformed_dfs = pudl.transform.eia923.transform(
-        eia923_raw_dfs, eia923_tables=eia923_tables)
-    eia860_transformed_dfs = pudl.transform.eia860.transform(
-        eia860_raw_dfs, eia860_tables=eia860_tables)
-    # create an eia transformed dfs dictionary
-    eia_transformed_dfs = eia860_transformed_dfs.copy()
-    eia_transformed_dfs.update(eia923_transformed_dfs.copy())
-    # convert types..
-    eia_transformed_dfs = pudl.helpers.convert_dfs_dict_dtypes(
-        eia_transformed_dfs, 'eia')
-
-    entities_dfs, eia_transformed_dfs = pudl.transform.eia.transform(
-        eia_transformed_dfs,
-        eia923_years=eia923_years,
-        eia860_years=eia860_years
-    )
-    # convert types..
-    entities_dfs = pudl.helpers.convert_dfs_dict_dtypes(entities_dfs, 'eia')
+    eia_dfs = _cached_dfs(
+        pudl_settings, "eia", _transform_eia,
+        eia923_tables, eia923_years, eia860_tables, eia860_years,
+        pudl_settings["data_dir"], pudl_settings.get("excel_cache_dir"))
 
-    # Compile transformed dfs for loading...
-    transformed_dfs = {"Entities": entities_dfs, "EIA": eia_transformed_dfs}
     # Load step
-    for data_source, transformed_df in transformed_dfs.items():
-        pudl.load.csv.dict_dump(transformed_df,
-                                data_source,
-                                datapkg_dir=datapkg_dir)
+    pudl.load.csv.dict_dump(eia_dfs, "EIA", datapkg_dir=datapkg_dir)
 
-    return list(eia_transformed_dfs.keys()) + list(entities_dfs.keys()) + static_tables
+    return list(eia_dfs.keys()) + static_tables
 
 
 ###############################################################################
@@ -259,11 +393,12 @@ def _validate_params_ferc1(etl_params):  # noqa: C901
         ferc1_dict['debug'] = False
 
     if (not ferc1_dict['debug']) and (ferc1_dict['ferc1_tables']):
-        for table in ferc1_dict['ferc1_tables']:
-            if table not in pc.pudl_tables["ferc1"]:
-                raise AssertionError(
-                    f"Unrecognized FERC table: {table}."
-                )
+        bad_tables = (set(ferc1_dict['ferc1_tables'])
+                      - set(pc.pudl_tables["ferc1"]))
+        if bad_tables:
+            raise AssertionError(
+                f"Unrecognized FERC tables: {sorted(bad_tables)}."
+            )
     if not ferc1_dict['ferc1_years']:
         return {}
     else:
@@ -310,6 +445,29 @@ def _load_static_tables_ferc1(datapkg_dir):
     return list(static_dfs.keys())
 
 
+def _transform_ferc1(ferc1_tables, ferc1_years, pudl_settings):
+    """Extract and transform the FERC Form 1 data.
+
+    Args:
+        ferc1_tables (list): FERC Form 1 tables to transform.
+        ferc1_years (list): Years of FERC Form 1 data to extract.
+        pudl_settings (dict) : a dictionary filled with settings that mostly
+            describe paths to various resources and outputs.
+
+    Returns:
+        dict: The transformed FERC Form 1 DataFrames, keyed by table name.
+
+    """
+    # Extract FERC form 1
+    ferc1_raw_dfs = pudl.extract.ferc1.extract(
+        ferc1_tables=ferc1_tables,
+        ferc1_years=ferc1_years,
+        pudl_settings=pudl_settings)
+    # Transform FERC form 1
+    return pudl.transform.ferc1.transform(
+        ferc1_raw_dfs, ferc1_tables=ferc1_tables)
+
+
 def _etl_ferc1(etl_params, datapkg_dir, pudl_settings):
     """
     Extracts, transforms and loads CSVs for FERC Form 1.
@@ -335,14 +493,9 @@ def _etl_ferc1(etl_params, datapkg_dir, pudl_settings):
         return []
 
     static_tables = _load_static_tables_ferc1(datapkg_dir)
-    # Extract FERC form 1
-    ferc1_raw_dfs = pudl.extract.ferc1.extract(
-        ferc1_tables=ferc1_tables,
-        ferc1_years=ferc1_years,
-        pudl_settings=pudl_settings)
-    # Transform FERC form 1
-    ferc1_transformed_dfs = pudl.transform.ferc1.transform(
-        ferc1_raw_dfs, ferc1_tables=ferc1_tables)
+    ferc1_transformed_dfs = _cached_dfs(
+        pudl_settings, "ferc1", _transform_ferc1,
+        ferc1_tables, ferc1_years, pudl_settings)
     # Load FERC form 1
     pudl.load.csv.dict_dump(ferc1_transformed_dfs,
                             "FERC 1",
@@ -430,12 +583,22 @@ def _etl_epacems(etl_params, datapkg_dir, pudl_settings):
     if logger.isEnabledFor(logging.INFO):
         start_time = time.monotonic()
     epacems_tables = []
-    # run the cems generator dfs through the load step
-    for transformed_df_dict in epacems_transformed_dfs:
-        pudl.load.csv.dict_dump(transformed_df_dict,
-                                "EPA CEMS",
-                                datapkg_dir=datapkg_dir)
-        epacems_tables.append(list(transformed_df_dict.keys())[0])
+    # run the cems generator dfs through the load step. Each CSV is written
+    # by a single background thread while the generators extract & transform
+    # the next year/state, waiting on the previous write before submitting
+    # the next one so that only one write is ever in flight.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as write_pool:
+        pending = None
+        for transformed_df_dict in epacems_transformed_dfs:
+            if pending is not None:
+                pending.result()
+            pending = write_pool.submit(pudl.load.csv.dict_dump,
+                                        transformed_df_dict,
+                                        "EPA CEMS",
+                                        datapkg_dir=datapkg_dir)
+            epacems_tables.append(list(transformed_df_dict.keys())[0])
+        if pending is not None:
+            pending.result()
     if logger.isEnabledFor(logging.INFO):
         time_message = "    Loading    EPA CEMS took {}".format(
             time.strftime("%H:%M:%S",
@@ -762,7 +925,7 @@ def validate_params(datapkg_bundle_settings, pudl_settings):
     return validated_settings
 
 
-def etl(datapkg_settings, output_dir, pudl_settings):
+def etl(datapkg_settings, output_dir, pudl_settings, parallel=False):
     """
     Run ETL process for data package specified by datapkg_settings dictionary.
 
@@ -779,6 +942,12 @@ def etl(datapkg_settings, output_dir, pudl_settings):
             will contain the datapackage.json file and the data directory.
         pudl_settings (dict): a dictionary describing paths to various
             resources and outputs.
+        parallel (bool): If True, run each dataset's ETL function in its own
+            process, at the same time as the others. This is faster, but the
+            peak memory use becomes the sum of all the datasets' peaks (EIA
+            and EPA CEMS together need much more than either alone), and each
+            dataset's outputs have to be passed back from its process. If
+            False (the default), the datasets are processed one at a time.
 
     Returns:
         list: The names of the tables included in the output datapackage.
@@ -793,10 +962,34 @@ def etl(datapkg_settings, output_dir, pudl_settings):
         "glue": _etl_glue,
         "epaipm": _etl_epaipm,
     }
-    for dataset_dict in datapkg_settings['datasets']:
-        for dataset in dataset_dict:
+    datasets = [
+        (dataset, dataset_dict[dataset])
+        for dataset_dict in datapkg_settings['datasets']
+        for dataset in dataset_dict
+    ]
+    if not datasets:
+        return processed_tables
+    if not parallel:
+        for dataset, etl_params in datasets:
             new_tables = etl_funcs[dataset](
-                dataset_dict[dataset], output_dir, pudl_settings)
+                etl_params, output_dir, pudl_settings)
+            if new_tables:
+                processed_tables.extend(new_tables)
+        return processed_tables
+
+    # Each dataset writes its own CSVs and shares no state with the others,
+    # so their ETL functions can run side by side in separate processes.
+    # Results are collected in submission order to keep the table listing
+    # deterministic.
+    max_workers = min(len(datasets), os.cpu_count() or 1)
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        futures = [
+            executor.submit(etl_funcs[dataset], etl_params,
+                            output_dir, pudl_settings)
+            for dataset, etl_params in datasets
+        ]
+        for future in futures:
+            new_tables = future.result()
             if new_tables:
                 processed_tables.extend(new_tables)
     return processed_tables
@@ -806,7 +999,8 @@ def generate_datapkg_bundle(datapkg_bundle_settings,
                             pudl_settings,
                             datapkg_bundle_name,
                             datapkg_bundle_doi=None,
-                            clobber=False):
+                            clobber=False,
+                            parallel=False):
     """
     Coordinate the generation of data packages.
 
@@ -830,6 +1024,9 @@ def generate_datapkg_bundle(datapkg_bundle_settings,
             packages with the datapkg_bundle_name, the existing data packages
             will be deleted and new data packages will be generated in their
             place.
+        parallel (bool): If True, process the datasets within each data
+            package in parallel, at the cost of higher peak memory use. See
+            :func:`etl`.
 
     Returns:
         dict: A dictionary with datapackage names as the keys, and Python
@@ -858,7 +1055,8 @@ def generate_datapkg_bundle(datapkg_bundle_settings,
         _ = pudl.helpers.prep_dir(output_dir / "data", clobber=clobber)
         # run the ETL functions for this pkg and return the list of tables
         # output to CSVs:
-        datapkg_resources = etl(datapkg_settings, output_dir, pudl_settings)
+        datapkg_resources = etl(datapkg_settings, output_dir, pudl_settings,
+                                parallel=parallel)
 
         if datapkg_resources:
             descriptor = pudl.load.metadata.generate_metadata(
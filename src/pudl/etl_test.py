@@ -0,0 +1,82 @@
+"""Unit tests for the transform cache in the pudl.etl module."""
+import tempfile
+import unittest
+import unittest.mock as mock
+
+import pandas as pd
+
+import pudl.etl as etl
+
+
+def _make_dfs(tables, years):
+    """Fake ETL step, returning a small DataFrame per table."""
+    return {
+        table: pd.DataFrame({
+            'report_year': pd.array(years, dtype='Int64'),
+            'table': table,
+        })
+        for table in tables
+    }
+
+
+class TestCachedDfs(unittest.TestCase):
+    """Tests reading and writing the cached transform outputs."""
+
+    def setUp(self):
+        """Creates a scratch cache directory and a fake ETL step."""
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp_dir.cleanup)
+        self._settings = {'transform_cache_dir': self._tmp_dir.name}
+        self._step = mock.Mock(side_effect=_make_dfs)
+
+    def _run(self, tables=('zeta', 'alpha'), years=(2017, 2018)):
+        return etl._cached_dfs(
+            self._settings, 'test', self._step, list(tables), list(years))
+
+    def test_no_cache_dir(self):
+        """Without a cache directory the step always runs."""
+        self._settings = {}
+        self._run()
+        self._run()
+        self.assertEqual(2, self._step.call_count)
+
+    def test_hit(self):
+        """A second run with the same inputs reads the cached outputs."""
+        expected = self._run()
+        actual = self._run()
+        self.assertEqual(1, self._step.call_count)
+        # The tables come back in the order the step returned them.
+        self.assertListEqual(['zeta', 'alpha'], list(actual))
+        for table, df in expected.items():
+            pd.testing.assert_frame_equal(df, actual[table])
+
+    def test_miss_on_new_inputs(self):
+        """Different tables or years don't reuse the cached outputs."""
+        self._run()
+        self._run(tables=('alpha',))
+        self._run(years=(2018,))
+        self.assertEqual(3, self._step.call_count)
+
+    def test_miss_on_code_change(self):
+        """Changes to the pudl package invalidate the cached outputs."""
+        with mock.patch.object(etl, '_code_digest', return_value='before'):
+            self._run()
+            self._run()
+        with mock.patch.object(etl, '_code_digest', return_value='after'):
+            self._run()
+        self.assertEqual(2, self._step.call_count)
+
+    def test_code_digest_covers_package(self):
+        """The helpers, constants and packaged data are all hashed."""
+        read = []
+        with mock.patch('pathlib.Path.read_bytes', autospec=True,
+                        side_effect=lambda path: read.append(path) or b''):
+            etl._code_digest.cache_clear()
+            etl._code_digest()
+        etl._code_digest.cache_clear()
+        read = {path.as_posix() for path in read}
+        for suffix in ('pudl/helpers.py', 'pudl/constants.py',
+                       'pudl/transform/eia923.py'):
+            self.assertTrue(any(path.endswith(suffix) for path in read),
+                            suffix)
+        self.assertTrue(any('/package_data/' in path for path in read))
@@ -8,8 +8,6 @@ This code is for use analyzing EIA Form 860 data.
 
 import logging
 
-import pandas as pd
-
 import pudl.extract.excel as excel
 
 logger = logging.getLogger(__name__)
@@ -19,6 +17,14 @@ class Extractor(excel.GenericExtractor):
     """Extractor for the excel dataset EIA860."""
 
     METADATA = excel.Metadata('eia860')
+    TABLE_PAGES = {
+        'boiler_generator_assn_eia860': ('boiler_generator_assn',),
+        'utilities_eia860': ('utility',),
+        'plants_eia860': ('plant',),
+        'generators_eia860': ('generator_existing', 'generator_proposed',
+                              'generator_retired'),
+        'ownership_eia860': ('ownership',),
+    }
 
     PAGE_GLOBS = {
         'boiler_generator_assn': '*EnviroAssoc*',
@@ -44,7 +50,4 @@ class Extractor(excel.GenericExtractor):
     @staticmethod
     def get_dtypes(year, page):
         """Returns dtypes for plant id columns."""
-        return {
-            "Plant ID": pd.Int64Dtype(),
-            "Plant Id": pd.Int64Dtype(),
-        }
+        return excel.PLANT_ID_DTYPES
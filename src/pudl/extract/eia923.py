@@ -9,18 +9,28 @@ years 2009-2016 work, as they share nearly identical file formatting.
 
 import logging
 
-import pandas as pd
-
 import pudl.extract.excel as excel
 
 logger = logging.getLogger(__name__)
 
 
+def _not_reserved(col):
+    """Returns True unless col is one of the placeholder "reserved" columns."""
+    return not str(col).strip().lower().startswith('reserved')
+
+
 class Extractor(excel.GenericExtractor):
     """Extractor for EIA form 923."""
 
     METADATA = excel.Metadata('eia923')
     BLACKLISTED_PAGES = ['plant_frame']
+    TABLE_PAGES = {
+        'generation_fuel_eia923': ('generation_fuel',),
+        'boiler_fuel_eia923': ('boiler_fuel',),
+        'generation_eia923': ('generator',),
+        'coalmine_eia923': ('fuel_receipts_costs',),
+        'fuel_receipts_costs_eia923': ('fuel_receipts_costs',),
+    }
 
     # Pages not supported by the metadata:
     # puerto_rico, github issue #457
@@ -60,7 +70,9 @@ class Extractor(excel.GenericExtractor):
     @staticmethod
     def get_dtypes(year, page):
         """Returns dtypes for plant id columns."""
-        return {
-            "Plant ID": pd.Int64Dtype(),
-            "Plant Id": pd.Int64Dtype(),
-        }
+        return excel.PLANT_ID_DTYPES
+
+    @staticmethod
+    def get_usecols(year, page):
+        """Skips parsing the empty reserved columns, which get dropped."""
+        return _not_reserved
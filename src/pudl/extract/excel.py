@@ -1,9 +1,13 @@
 """Load excel metadata CSV files form a python data package."""
 
+import concurrent.futures
 import glob
+import hashlib
 import importlib.resources
 import logging
+import os
 import os.path
+import pathlib
 
 import pandas as pd
 
@@ -13,6 +17,14 @@ import pudl.workspace.datastore as datastore
 
 logger = logging.getLogger(__name__)
 
+# The EIA spreadsheets report plant IDs under either of these column names.
+# Reading them as nullable integers keeps them from becoming floats wherever
+# a record is missing its plant ID.
+PLANT_ID_DTYPES = {
+    "Plant ID": pd.Int64Dtype(),
+    "Plant Id": pd.Int64Dtype(),
+}
+
 
 class Metadata(object):
     """Loads excel metadata from python package.
@@ -111,13 +123,18 @@ class GenericExtractor(object):
     available. This can be used for experimental/new code that should not be
     run yet.
 
-    3. file_basename_glob() tells us what is the basename of the excel file
+    3. TABLE_PAGES class attribute maps the PUDL tables built from this
+    dataset to the pages that they need, so that only those pages are loaded
+    when extract() is asked for a subset of the tables.
+
+    4. file_basename_glob() tells us what is the basename of the excel file
     that contains the data for a given (year, page).
 
-    4. dtypes() should return dict with {column_name: pandas_datatype} if you
-    need to specify which datatypes should be uded upon loading.
+    5. dtypes() should return dict with {column_name: pandas_datatype} if you
+    need to specify which datatypes should be uded upon loading, and
+    get_usecols() can limit which columns are parsed at all.
 
-    5. If data cleanup is necessary, you can apply custom logic by overriding
+    6. If data cleanup is necessary, you can apply custom logic by overriding
     one of the following functions (they all return the modified dataframe):
     - process_raw() is applied right after loading the excel DataFrame
     from the disk.
@@ -133,14 +150,21 @@ class GenericExtractor(object):
     BLACKLISTED_PAGES = []
     """List of supported pages that should not be extracted."""
 
-    def __init__(self, data_dir, metadata=None):
+    TABLE_PAGES = {}
+    """Dict mapping PUDL tables to the tuple of pages needed to produce them."""
+
+    def __init__(self, data_dir, metadata=None, cache_dir=None):
         """Create new extractor object and load metadata.
 
         Args:
             data_dir: Path to the data_dir to use when loading excel
               files from disk (passed to datastore).
+            cache_dir: Optional path to a directory in which the raw
+              DataFrames read from excel files are cached for reuse by
+              later runs (see _read_excel_page()).
         """
         self._data_dir = data_dir
+        self._cache_dir = cache_dir
         if not self.METADATA:
             raise NotImplementedError('self.METADATA must be set.')
         self._metadata = self.METADATA
@@ -167,39 +191,58 @@ class GenericExtractor(object):
         """Provide custom dtypes for given page and year."""
         return {}
 
-    def extract(self, years):
+    @staticmethod
+    def get_usecols(year, page):
+        """Provide the usecols argument for reading given page and year.
+
+        Returns None (the default) to read every column, or a pd.read_excel()
+        compatible usecols value (e.g. a callable) to parse only some of them.
+        """
+        return None
+
+    def extract(self, years, tables=None):
         """Extracts dataframes.
 
         Returns dict where keys are page names and values are
-        DataFrames containing data across given years.
+        DataFrames containing data across given years. If tables is given,
+        only the pages that TABLE_PAGES says those tables need are extracted.
         """
         # TODO: should we run verify_years(?) here?
         if not years:
             logger.info(
-                f'No years given. Not extracting {self.DATSET} spreadsheet data.')
+                f'No years given. Not extracting {self._dataset_name} spreadsheet data.')
             return {}
 
-        raw_dfs = {}
+        if tables is None:
+            needed_pages = set(self._metadata.get_all_pages())
+        else:
+            needed_pages = set().union(
+                *(self.TABLE_PAGES[table] for table in tables))
+        pages = []
         for page in self._metadata.get_all_pages():
+            if page not in needed_pages:
+                continue
             if page in self.BLACKLISTED_PAGES:
                 logger.info(f'Skipping blacklisted page {page}.')
                 continue
-            df = pd.DataFrame()
-            for yr in years:
-                logger.info(
-                    f'Loading dataframe for {self._dataset_name} {page} {yr}')
-                newdata = pd.read_excel(
-                    self._load_excel_file(yr, page),
-                    sheet_name=self._metadata.get_sheet_name(yr, page),
-                    skiprows=self._metadata.get_skiprows(yr, page),
-                    dtype=self.get_dtypes(yr, page))
-
-                newdata = pudl.helpers.simplify_columns(newdata)
-                newdata = self.process_raw(newdata, yr, page)
-                newdata = newdata.rename(
-                    columns=self._metadata.get_column_map(yr, page))
-                newdata = self.process_renamed(newdata, yr, page)
-                df = df.append(newdata, sort=True, ignore_index=True)
+            pages.append(page)
+
+        # Each year's spreadsheets are independent of the others', so the
+        # years are read concurrently. All of the pages for a given year are
+        # read by the same thread, so that each excel file is only ever used
+        # by one thread at a time.
+        max_workers = min(len(years), os.cpu_count() or 1)
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            futures = [executor.submit(self._extract_year, yr, pages)
+                       for yr in years]
+            yearly_dfs = [future.result() for future in futures]
+
+        raw_dfs = {}
+        for page in pages:
+            # Pop each year's frame as it's consolidated, so only one page is
+            # ever held twice over, rather than every page at once.
+            df = pd.concat([dfs.pop(page) for dfs in yearly_dfs],
+                           sort=True, ignore_index=True)
 
             # After all years are loaded, consolidate missing columns
             missing_cols = set(self._metadata.get_all_columns(
@@ -209,16 +252,81 @@ class GenericExtractor(object):
             raw_dfs[page] = self.process_final_page(df, page)
         return raw_dfs
 
+    def _extract_year(self, year, pages):
+        """Returns dict of renamed DataFrames for given pages of a single year."""
+        dfs = {}
+        for page in pages:
+            logger.info(
+                f'Loading dataframe for {self._dataset_name} {page} {year}')
+            newdata = self._read_excel_page(year, page)
+
+            newdata = pudl.helpers.simplify_columns(newdata)
+            newdata = self.process_raw(newdata, year, page)
+            newdata = newdata.rename(
+                columns=self._metadata.get_column_map(year, page))
+            dfs[page] = self.process_renamed(newdata, year, page)
+        return dfs
+
+    def _read_excel_page(self, year, page):
+        """Returns the raw DataFrame read from excel for given (year, page).
+
+        If this extractor has a cache_dir, the DataFrame is also pickled there,
+        keyed by the path, size and modification time of the spreadsheet and
+        the arguments it is read with, and later reads of the same page are
+        served from that file rather than by parsing the spreadsheet again.
+        Pickling (rather than e.g. Parquet) preserves the mixed-type object
+        columns that raw excel pages often contain.
+        """
+        read_args = {
+            'sheet_name': self._metadata.get_sheet_name(year, page),
+            'skiprows': self._metadata.get_skiprows(year, page),
+            'dtype': self.get_dtypes(year, page),
+        }
+        usecols = self.get_usecols(year, page)
+        if usecols is not None:
+            read_args['usecols'] = usecols
+        if self._cache_dir is None:
+            return pd.read_excel(self._load_excel_file(year, page), **read_args)
+
+        full_path = self._get_file_path(year, page)
+        stat = os.stat(full_path)
+        # Functions are identified by name, as their repr varies across runs.
+        key_args = {k: getattr(v, '__qualname__', v)
+                    for k, v in read_args.items()}
+        key = hashlib.sha1(repr(
+            (full_path, stat.st_size, stat.st_mtime_ns, key_args)
+        ).encode()).hexdigest()
+        cache_path = pathlib.Path(
+            self._cache_dir, self._dataset_name, f'{key}.pkl')
+        if cache_path.exists():
+            logger.debug(
+                f'{self._dataset_name}: Reading cached {page} {year}')
+            return pd.read_pickle(cache_path)
+
+        df = pd.read_excel(self._load_excel_file(year, page), **read_args)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so an interrupted run can't leave a partial file.
+        tmp_path = cache_path.with_suffix('.tmp')
+        df.to_pickle(tmp_path)
+        os.replace(tmp_path, cache_path)
+        return df
+
     def _load_excel_file(self, year, page):
         """Returns ExcelFile object corresponding to given (year, page).
 
         Additionally, loaded files are stored under self._file_cache for reuse.
+        Newer .xlsx workbooks are opened with openpyxl, which pandas runs in
+        read-only mode, streaming each sheet as it is parsed rather than
+        loading the whole workbook up front. Older .xls workbooks can only be
+        read with xlrd.
         """
         full_path = self._get_file_path(year, page)
         if full_path not in self._file_cache:
             logger.info(
                 f'{self._dataset_name}: Loading excel file {full_path}')
-            self._file_cache[full_path] = pd.ExcelFile(full_path)
+            engine = 'openpyxl' if full_path.endswith('.xlsx') else None
+            self._file_cache[full_path] = pd.ExcelFile(
+                full_path, engine=engine)
         return self._file_cache[full_path]
 
     def verify_years(self, years):
@@ -1,4 +1,6 @@
 """Unit tests for pudl.extract.excel module."""
+import os.path
+import tempfile
 import unittest
 import unittest.mock as mock
 from unittest.mock import patch
@@ -96,5 +98,36 @@ class TestGenericExtractor(unittest.TestCase):
             }),
             dfs['boxes'])
 
+    @patch('pudl.extract.excel.pd.read_excel', _fake_data_frames)
+    def test_table_pages(self):
+        """Checks that only the pages needed by the given tables are read."""
+        class TableFakeExtractor(FakeExtractor):
+            TABLE_PAGES = {'library': ('books',), 'warehouse': ('boxes',)}
+
+        dfs = TableFakeExtractor('/blah').extract(
+            [2010, 2011], tables=['library'])
+        self.assertEqual(set(['books']), set(dfs.keys()))
+
+    def test_cached_pages(self):
+        """Checks that cached pages are read back instead of re-parsed."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            class CachingFakeExtractor(FakeExtractor):
+                def _get_file_path(self, year, page):
+                    path = os.path.join(tmp_dir, f'{page}-{year}.xlsx')
+                    open(path, 'a').close()
+                    return path
+
+            cache_dir = os.path.join(tmp_dir, 'cache')
+            with patch('pudl.extract.excel.pd.read_excel',
+                       side_effect=_fake_data_frames) as mock_read_excel:
+                first = CachingFakeExtractor(
+                    '/blah', cache_dir=cache_dir).extract([2010, 2011])
+                self.assertEqual(4, mock_read_excel.call_count)
+                second = CachingFakeExtractor(
+                    '/blah', cache_dir=cache_dir).extract([2010, 2011])
+                self.assertEqual(4, mock_read_excel.call_count)
+            for page in ['books', 'boxes']:
+                pd.testing.assert_frame_equal(first[page], second[page])
+
     # TODO(rousik@gmail.com): need to figure out how to test process_$x methods.
     # TODO(rousik@gmail.com): we should test that empty columns are properly added.
@@ -49,10 +49,17 @@ for further processing and integration with other data sources like the EIA 860
 and EIA 923.
 
 """
+import atexit
+import collections
+import concurrent.futures
+import contextlib
+import functools
 import logging
+import multiprocessing
 import os.path
 import re
 import string
+import threading
 
 import dbfread
 import pandas as pd
@@ -64,6 +71,51 @@ import pudl.workspace.datastore as datastore
 
 logger = logging.getLogger(__name__)
 
+# Shared engines for the FERC Form 1 DB, keyed by database URL and process ID.
+# See get_ferc1_engine().
+_FERC1_ENGINES = {}
+_FERC1_ENGINES_LOCK = threading.Lock()
+
+# Integer ID columns found in most FERC Form 1 tables, and the smallest dtypes
+# that can safely hold them. spplmnt_num gets 32 bits because it's used in
+# arithmetic downstream (see plants_small).
+FERC1_ID_DTYPES = {
+    'report_year': 'int16',
+    'respondent_id': 'int32',
+    'spplmnt_num': 'int32',
+    'row_number': 'int32',
+    'row_seq': 'int32',
+}
+
+# The years of data to select from the FERC Form 1 DB are passed in as a
+# single expanding bound parameter, rather than being rendered into the SQL
+# as literal values, so the text of each query is the same no matter how many
+# or which years are requested.
+REPORT_YEARS = sa.bindparam('report_years', expanding=True)
+
+# Respondents which are referred to in the FERC Form 1 data, but which do not
+# appear in the f1_respondent_id table. We can insert info into any of the
+# columns for this table through the following dictionaries, but each of the
+# records need to have all of the same columns (you can't add a column for one
+# respondent without adding it to all).
+MISSING_RESPONDENTS = [
+    {'respondent_id': 514,
+     'respondent_name': 'AEP, Texas (PUDL determined)'},
+    {'respondent_id': 515,
+     'respondent_name': 'respondent_515'},
+    {'respondent_id': 516,
+     'respondent_name': 'respondent_516'},
+    {'respondent_id': 517,
+     'respondent_name': 'respondent_517'},
+    {'respondent_id': 518,
+     'respondent_name': 'respondent_518'},
+    {'respondent_id': 519,
+     'respondent_name': 'respondent_519'},
+    {'respondent_id': 522,
+     'respondent_name':
+     'Luning Energy Holdings LLC, Invenergy Investments (PUDL determined)'},
+]
+
 
 def drop_tables(engine):
     """Drop all FERC Form 1 tables from the SQLite database.
@@ -72,9 +124,6 @@ def drop_tables(engine):
     database that the passed in ``engine`` refers to, and uses that schema to
     drop all existing tables.
 
-    Todo:
-        Treat DB connection as a context manager (with/as).
-
     Args:
         engine (:class:`sqlalchemy.engine.Engine`): A DB Engine pointing at an
             exising SQLite database to be deleted.
@@ -86,9 +135,8 @@ def drop_tables(engine):
     md = sa.MetaData(bind=engine)
     md.reflect(engine)
     md.drop_all(engine)
-    conn = engine.connect()
-    conn.execute("VACUUM")
-    conn.close()
+    with engine.connect() as conn:
+        conn.execute("VACUUM")
 
 
 def add_sqlite_table(table_name, sqlite_meta, dbc_map, data_dir,
@@ -393,6 +441,101 @@ class FERC1FieldParser(dbfread.FieldParser):
         return super(FERC1FieldParser, self).parseN(field, data)
 
 
+def _read_raw_df(table, dbc_map, data_dir, year):
+    """Read a single year of a FERC Form 1 DBF table.
+
+    This is a module level function so that it can be run in worker processes.
+
+    Args:
+        table (string): The name of the FERC Form 1 table from which data is
+            read.
+        dbc_map (dict of dicts): A dictionary of dictionaries, of the kind
+            returned by get_dbc_map(), describing the table and column names
+            stored within the FERC Form 1 FoxPro database files.
+        data_dir (str): A string representing the full path to the top level of
+            the PUDL datastore containing the FERC Form 1 data to be used.
+        year (int): The year of data to read.
+
+    Returns:
+        :class:`pandas.DataFrame`: One year of FERC Form 1 data for the given
+        table, with the database column names, or None if the DBF file for
+        that year doesn't exist.
+
+    """
+    dbf_path = get_dbf_path(table, year, data_dir=data_dir)
+    if not os.path.exists(dbf_path):
+        return None
+    return (
+        pd.DataFrame(
+            iter(dbfread.DBF(dbf_path,
+                             encoding='latin1',
+                             parserclass=FERC1FieldParser))).
+        drop('_NullFlags', axis=1, errors='ignore').
+        rename(dbc_map[table], axis=1)
+    )
+
+
+def _iter_raw_dfs(table, dbc_map, data_dir, years, executor=None):
+    """Read a FERC Form 1 DBF table one year at a time.
+
+    Args:
+        table (string): The name of the FERC Form 1 table from which data is
+            read.
+        dbc_map (dict of dicts): A dictionary of dictionaries, of the kind
+            returned by get_dbc_map(), describing the table and column names
+            stored within the FERC Form 1 FoxPro database files.
+        data_dir (str): A string representing the full path to the top level of
+            the PUDL datastore containing the FERC Form 1 data to be used.
+        years (list): The years of data to read.
+        executor (concurrent.futures.ProcessPoolExecutor): If given, the DBF
+            files are parsed in its worker processes, several years at a time,
+            rather than one after another in this process.
+
+    Yields:
+        :class:`pandas.DataFrame`: One year of FERC Form 1 data for the given
+        table, with the database column names, in the order of years. Years
+        for which the DBF file doesn't exist are skipped.
+
+    """
+    if executor is None:
+        raw_dfs = (_read_raw_df(table, dbc_map, data_dir, yr) for yr in years)
+    else:
+        raw_dfs = _prefetch(
+            executor, _read_raw_df, [(table, dbc_map, data_dir, yr)
+                                     for yr in years])
+    for raw_df in raw_dfs:
+        if raw_df is not None:
+            yield raw_df
+
+
+def _prefetch(executor, fn, args_list, depth=None):
+    """Run fn over args_list in executor, yielding results in order.
+
+    Unlike Executor.map(), which submits everything at once, only ``depth``
+    calls are in flight at any time, so that the results waiting to be
+    consumed can't pile up in memory.
+
+    Args:
+        executor (concurrent.futures.Executor): The executor to run fn in.
+        fn (callable): The function to run.
+        args_list (list of tuples): Positional arguments for each call.
+        depth (int): The maximum number of calls in flight. Defaults to the
+            number of CPUs.
+
+    Yields:
+        The results of fn, in the order of args_list.
+
+    """
+    depth = depth or os.cpu_count() or 1
+    pending = collections.deque()
+    for args in args_list:
+        if len(pending) >= depth:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, *args))
+    while pending:
+        yield pending.popleft().result()
+
+
 def get_raw_df(table, dbc_map, data_dir, years=pc.data_years['ferc1']):
     """Combine several years of a given FERC Form 1 DBF table into a dataframe.
 
@@ -404,7 +547,6 @@ def get_raw_df(table, dbc_map, data_dir, years=pc.data_years['ferc1']):
             stored within the FERC Form 1 FoxPro database files.
         data_dir (str): A string representing the full path to the top level of
             the PUDL datastore containing the FERC Form 1 data to be used.
-        min_length (int): The minimum number of consecutive printable
         years (list): Range of years to be combined into a single DataFrame.
 
     Returns:
@@ -412,31 +554,13 @@ def get_raw_df(table, dbc_map, data_dir, years=pc.data_years['ferc1']):
         Form 1 data for the given table.
 
     """
-    dbf_name = pc.ferc1_tbl2dbf[table]
-
-    raw_dfs = []
-    for yr in years:
-        ferc1_dir = datastore.path(
-            'ferc1', year=yr, file=False, data_dir=data_dir)
-        dbf_path = os.path.join(ferc1_dir, f"{dbf_name}.DBF")
-
-        if os.path.exists(dbf_path):
-            new_df = pd.DataFrame(
-                iter(dbfread.DBF(dbf_path,
-                                 encoding='latin1',
-                                 parserclass=FERC1FieldParser)))
-            raw_dfs = raw_dfs + [new_df, ]
-
+    raw_dfs = list(_iter_raw_dfs(table, dbc_map, data_dir, years))
     if raw_dfs:
-        return (
-            pd.concat(raw_dfs, sort=True).
-            drop('_NullFlags', axis=1, errors='ignore').
-            rename(dbc_map[table], axis=1)
-        )
+        return pd.concat(raw_dfs, sort=True)
 
 
 def dbf2sqlite(tables, years, refyear, pudl_settings,
-               bad_cols=(), clobber=False):
+               bad_cols=(), clobber=False, parallel=False):
     """Clone the FERC Form 1 Databsae to SQLite.
 
     Args:
@@ -449,6 +573,10 @@ def dbf2sqlite(tables, years, refyear, pudl_settings,
             indicating columns that should be skipped during the cloning
             process. Both table and column are strings in this case, the
             names of their respective entities within the database metadata.
+        clobber (bool): Whether to replace an existing database.
+        parallel (bool): If True, parse the DBF files for each year in a pool
+            of worker processes, while the records are written out here. If
+            False (the default), the years are read one at a time.
 
     Returns:
         None
@@ -456,15 +584,16 @@ def dbf2sqlite(tables, years, refyear, pudl_settings,
     """
     # Read in the structure of the DB, if it exists
     logger.info("Dropping the old FERC Form 1 SQLite DB if it exists.")
-    sqlite_engine = sa.create_engine(pudl_settings["ferc1_db"])
+    sqlite_engine = pudl.helpers.create_bulk_load_engine(
+        pudl_settings["ferc1_db"])
     try:
         # So that we can wipe it out
         pudl.helpers.drop_tables(sqlite_engine, clobber=clobber)
     except sa.exc.OperationalError:
         pass
 
-    # And start anew
-    sqlite_engine = sa.create_engine(pudl_settings["ferc1_db"])
+    # And start anew, without any connections left over from the old DB
+    sqlite_engine.dispose()
     sqlite_meta = sa.MetaData(bind=sqlite_engine)
 
     # Get the mapping of filenames to table names and fields
@@ -474,61 +603,133 @@ def dbf2sqlite(tables, years, refyear, pudl_settings,
                      refyear=refyear, bad_cols=bad_cols,
                      data_dir=pudl_settings['data_dir'])
 
-    for table in tables:
-        logger.info(f"Pandas: reading {table} into a DataFrame.")
-        new_df = get_raw_df(table, dbc_map, years=years,
-                            data_dir=pudl_settings['data_dir'])
-        # Because this table has no year in it, there would be multiple
-        # definitions of respondents if we didn't drop duplicates.
-        if table == 'f1_respondent_id':
-            new_df = new_df.drop_duplicates(
-                subset='respondent_id', keep='last')
-        n_recs = len(new_df)
-        logger.debug(f"    {table}: N = {n_recs}")
-        # Only try and load the table if there are some actual records:
-        if n_recs <= 0:
-            continue
-
-        # Write the records out to the SQLite database, and make sure that
-        # the inferred data types are being enforced during loading.
-        # if_exists='append' is being used because we defined the tables
-        # above, but left them empty. Becaue the DB is reset at the beginning
-        # of the function, this shouldn't ever result in duplicate records.
-        coltypes = {col.name: col.type for col in sqlite_meta.tables[table].c}
-        logger.info(f"SQLite: loading {n_recs} rows into {table}.")
-        new_df.to_sql(table, sqlite_engine,
-                      if_exists='append', chunksize=100000,
-                      dtype=coltypes, index=False)
-        # add the missing respondents into the respondent_id table.
-        if table == 'f1_respondent_id':
-            logger.debug(f'inserting missing respondents into {table}')
-            sa.insert(sqlite_meta.tables['f1_respondent_id'],
-                      # we can insert info info into any of the columns for this
-                      # table through the following dictionary, but each of the
-                      # records need to have all of the same columns (you can't
-                      # add a column for one respondent without adding it to all).
-                      values=[
-                      {'respondent_id': 514,
-                       'respondent_name': 'AEP, Texas (PUDL determined)'},
-                      {'respondent_id': 515,
-                       'respondent_name': 'respondent_515'},
-                      {'respondent_id': 516,
-                       'respondent_name': 'respondent_516'},
-                      {'respondent_id': 517,
-                       'respondent_name': 'respondent_517'},
-                      {'respondent_id': 518,
-                       'respondent_name': 'respondent_518'},
-                      {'respondent_id': 519,
-                       'respondent_name': 'respondent_519'},
-                      {'respondent_id': 522,
-                       'respondent_name':
-                       'Luning Energy Holdings LLC, Invenergy Investments (PUDL determined)'},
-            ]).execute()
+    # Load all of the tables within a single transaction, so that the records
+    # are only committed (and synced to disk) once.
+    # If requested, the DBF files are parsed in worker processes, while the
+    # records are written out serially here, since SQLite only allows a single
+    # writer. The pool is set up before the transaction is opened, and its
+    # workers are spawned rather than forked, since they're only started on
+    # demand and mustn't inherit the open database connection.
+    with contextlib.ExitStack() as stack:
+        executor = None
+        if parallel:
+            executor = stack.enter_context(
+                concurrent.futures.ProcessPoolExecutor(
+                    mp_context=multiprocessing.get_context('spawn')))
+        conn = stack.enter_context(sqlite_engine.begin())
+        for table in tables:
+            # Write the records out to the SQLite database table we defined
+            # above, which makes sure that the inferred data types are being
+            # enforced during loading. The tables were left empty, and because
+            # the DB is reset at the beginning of the function, this shouldn't
+            # ever result in duplicate records.
+            sa_table = sqlite_meta.tables[table]
+
+            # Because this table has no year in it, there would be multiple
+            # definitions of respondents if we didn't drop duplicates, so we
+            # need to read all the years in at once.
+            if table == 'f1_respondent_id':
+                logger.info(f"Pandas: reading {table} into a DataFrame.")
+                new_df = get_raw_df(table, dbc_map, years=years,
+                                    data_dir=pudl_settings['data_dir'])
+                new_df = new_df.drop_duplicates(
+                    subset='respondent_id', keep='last')
+                # Add the missing respondents to the same load. If FERC has
+                # since reported any of them, keep the reported record rather
+                # than attempting to insert a conflicting primary key.
+                logger.debug(f'adding missing respondents to {table}')
+                new_df = (
+                    pd.concat([new_df, pd.DataFrame(MISSING_RESPONDENTS)],
+                              sort=False).
+                    drop_duplicates(subset='respondent_id', keep='first')
+                )
+                raw_dfs = [new_df]
+            # Every other table is loaded one year at a time, so only a single
+            # year of data needs to be held in memory.
+            else:
+                logger.info(f"Pandas: reading {table} one year at a time.")
+                raw_dfs = _iter_raw_dfs(table, dbc_map, years=years,
+                                        data_dir=pudl_settings['data_dir'],
+                                        executor=executor)
+
+            n_recs = 0
+            for new_df in raw_dfs:
+                # Only try and load the records if there are some:
+                if len(new_df) <= 0:
+                    continue
+                pudl.helpers.bulk_load(new_df, sa_table, conn)
+                n_recs += len(new_df)
+            logger.info(f"SQLite: loaded {n_recs} rows into {table}.")
+
+        # Index the tables that PUDL reads from by report year (and plant
+        # name, where present), since that's what they're filtered on.
+        for table in set(tables) & set(pc.table_map_ferc1_pudl.values()):
+            sa_table = sqlite_meta.tables[table]
+            idx_cols = [sa_table.c[col] for col in ('report_year', 'plant_name')
+                        if col in sa_table.c]
+            if idx_cols:
+                logger.debug(f"SQLite: indexing {table}.")
+                sa.Index(f"{table}_report_year_idx", *idx_cols).create(conn)
 
 
 ###########################################################################
 # Functions for extracting ferc1 tables from SQLite to PUDL
 ###########################################################################
+def get_ferc1_engine(ferc1_db):
+    """Get a shared SQL Alchemy engine for the cloned FERC Form 1 DB.
+
+    The same engine, and its pool of connections, is handed back every time
+    this is called with the same database URL, rather than setting up a new
+    one for each extraction. The pool holds a connection per CPU, since the
+    FERC Form 1 tables are read concurrently. The engines are disposed of,
+    closing their pooled connections, when the Python process exits.
+
+    Args:
+        ferc1_db (str): The SQL Alchemy URL of the FERC Form 1 DB, as found in
+            ``pudl_settings["ferc1_db"]``.
+
+    Returns:
+        :class:`sqlalchemy.engine.Engine`: An engine connected to the FERC
+        Form 1 DB.
+
+    """
+    # Connections mustn't be shared with a forked child process, so each
+    # process gets its own engine.
+    key = (ferc1_db, os.getpid())
+    with _FERC1_ENGINES_LOCK:
+        if key not in _FERC1_ENGINES:
+            pool_size = os.cpu_count() or 1
+            _FERC1_ENGINES[key] = sa.create_engine(
+                ferc1_db,
+                poolclass=sa.pool.QueuePool,
+                pool_size=pool_size,
+                max_overflow=pool_size,
+                pool_pre_ping=True,
+                # Pooled connections get checked out by whichever thread needs
+                # one, but are still only ever used by one thread at a time.
+                connect_args={'check_same_thread': False}
+                if ferc1_db.startswith('sqlite') else {},
+            )
+        return _FERC1_ENGINES[key]
+
+
+@atexit.register
+def dispose_ferc1_engines():
+    """Close the pooled connections of the shared FERC Form 1 DB engines.
+
+    Only the engines created by the current process are disposed of. Any
+    that were inherited from a parent process belong to the parent.
+
+    Returns:
+        None
+
+    """
+    pid = os.getpid()
+    with _FERC1_ENGINES_LOCK:
+        for key in [key for key in _FERC1_ENGINES if key[1] == pid]:
+            _FERC1_ENGINES.pop(key).dispose()
+
+
 def get_ferc1_meta(ferc1_engine):
     """Grab the FERC Form 1 DB metadata and check that tables exist.
 
@@ -560,7 +761,8 @@ def get_ferc1_meta(ferc1_engine):
 
 def extract(ferc1_tables=pc.pudl_tables['ferc1'],
             ferc1_years=pc.working_years['ferc1'],
-            pudl_settings=None):
+            pudl_settings=None,
+            parallel=True):
     """Coordinates the extraction of all FERC Form 1 tables into PUDL.
 
     Args:
@@ -570,6 +772,11 @@ def extract(ferc1_tables=pc.pudl_tables['ferc1'],
         ferc1_years (iterable of ints): List of years for which FERC Form 1
             data should be loaded into PUDL. Note that not all years for which
             FERC data is available may have been integrated into PUDL yet.
+        pudl_settings (dict): Dictionary containing paths and database URLs
+            used by PUDL.
+        parallel (bool): If True (the default), read the tables concurrently,
+            each over its own database connection. If False, read them one at
+            a time, which can make debugging and profiling easier.
 
     Returns:
         dict: A dictionary of pandas DataFrames, with the names of PUDL
@@ -605,48 +812,112 @@ def extract(ferc1_tables=pc.pudl_tables['ferc1'],
                 f"For now, the years which PUDL has integrated are: "
                 f"{' '.join(pc.working_years['ferc1'])}."
             )
-    for table in ferc1_tables:
-        if table not in pc.pudl_tables["ferc1"]:
-            raise ValueError(
-                f"FERC Form 1 table {table} was requested but it has not yet "
-                f"been integreated into PUDL. Heck, it might not even exist! "
-                f"If you'd like to contribute the necessary cleaning "
-                f"functions, come find us on GitHub: "
-                f"{pudl.__downloadurl__}"
-                f"For now, the tables which PUDL has integrated are: "
-                f"{' '.join(pc.pudl_tables['ferc1'])}"
-            )
+    bad_tables = set(ferc1_tables) - set(pc.pudl_tables["ferc1"])
+    if bad_tables:
+        raise ValueError(
+            f"FERC Form 1 tables {sorted(bad_tables)} were requested but "
+            f"have not yet been integreated into PUDL. Heck, they might not "
+            f"even exist! "
+            f"If you'd like to contribute the necessary cleaning "
+            f"functions, come find us on GitHub: "
+            f"{pudl.__downloadurl__}"
+            f"For now, the tables which PUDL has integrated are: "
+            f"{' '.join(pc.pudl_tables['ferc1'])}"
+        )
 
-    ferc1_meta = get_ferc1_meta(sa.create_engine(pudl_settings["ferc1_db"]))
-
-    ferc1_extract_functions = {
-        "fuel_ferc1": fuel,
-        "plants_steam_ferc1": plants_steam,
-        "plants_small_ferc1": plants_small,
-        "plants_hydro_ferc1": plants_hydro,
-        "plants_pumped_storage_ferc1": plants_pumped_storage,
-        "plant_in_service_ferc1": plant_in_service,
-        "purchased_power_ferc1": purchased_power,
-        "accumulated_depreciation_ferc1": accumulated_depreciation
-    }
+    ferc1_meta = get_ferc1_meta(
+        get_ferc1_engine(pudl_settings["ferc1_db"]))
 
-    ferc1_raw_dfs = {}
-    for pudl_table in ferc1_tables:
-        if pudl_table not in ferc1_extract_functions:
-            raise ValueError(
-                f"No extract function found for requested FERC Form 1 data "
-                f"table {pudl_table}!"
-            )
-        ferc1_sqlite_table = pc.table_map_ferc1_pudl[pudl_table]
-        logger.info(
-            f"Converting extracted FERC Form 1 table {pudl_table} into a "
-            f"pandas DataFrame.")
-        ferc1_raw_dfs[pudl_table] = ferc1_extract_functions[pudl_table](
-            ferc1_meta, ferc1_sqlite_table, ferc1_years)
+    missing_tables = set(ferc1_tables) - FERC1_EXTRACT_FUNCTIONS.keys()
+    if missing_tables:
+        raise ValueError(
+            f"No extract function found for requested FERC Form 1 data "
+            f"tables {sorted(missing_tables)}!"
+        )
+
+    # Each extract function reads a different table from the FERC Form 1 DB,
+    # and the work is dominated by waiting on SQLite, so we read them
+    # concurrently. The engine hands each thread its own connection.
+    extractors = {
+        pudl_table: functools.partial(
+            FERC1_EXTRACT_FUNCTIONS[pudl_table], ferc1_meta,
+            pc.table_map_ferc1_pudl[pudl_table], ferc1_years)
+        for pudl_table in ferc1_tables
+    }
+    max_workers = min(len(ferc1_tables), os.cpu_count() or 1) if parallel else 1
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = {}
+        for pudl_table, extractor in extractors.items():
+            logger.info(
+                f"Converting extracted FERC Form 1 table {pudl_table} into a "
+                f"pandas DataFrame.")
+            futures[pudl_table] = executor.submit(extractor)
+        ferc1_raw_dfs = {pudl_table: future.result()
+                         for pudl_table, future in futures.items()}
 
     return ferc1_raw_dfs
 
 
+def _data_columns(table):
+    """List the columns of a FERC Form 1 table, excluding footnote columns.
+
+    Every column in the FERC Form 1 DB has a companion footnote column, whose
+    name ends in "_f". PUDL doesn't use the footnotes, and they get dropped
+    during the transform step, so there's no reason to read them out of the
+    database in the first place.
+
+    Args:
+        table (sqlalchemy.Table): The FERC Form 1 table being selected from.
+
+    Returns:
+        list: The :class:`sqlalchemy.Column` objects to be selected.
+
+    """
+    return [col for col in table.c if not col.name.endswith('_f')]
+
+
+def _downcast_ids(df):
+    """Downcast the integer FERC Form 1 ID columns found in a dataframe."""
+    return df.astype({
+        col: dtype for col, dtype in FERC1_ID_DTYPES.items()
+        if col in df.columns and pd.api.types.is_integer_dtype(df[col])
+    })
+
+
+def _read_ferc1(select, ferc1_engine, ferc1_years, chunksize=100_000):
+    """Read the results of a FERC Form 1 query into a compact DataFrame.
+
+    The ID columns which appear in every FERC Form 1 table are returned as
+    64-bit integers by :func:`pandas.read_sql`, but their values are small, so
+    they're downcast to save memory in the (very long) raw dataframes. The
+    results are streamed from the database and downcast a chunk at a time, so
+    the full-size version of the dataframe never has to exist in memory.
+
+    Args:
+        select (sqlalchemy.sql.expression.Select): The query to run. It should
+            select the years of data using the :data:`REPORT_YEARS` parameter.
+        ferc1_engine (sqlalchemy.engine.Engine): Engine connected to the cloned
+            FERC Form 1 database.
+        ferc1_years (list): The years of data to select.
+        chunksize (int): The number of records to read at a time.
+
+    Returns:
+        pandas.DataFrame: The results of the query.
+
+    """
+    params = {REPORT_YEARS.key: list(ferc1_years)}
+    with ferc1_engine.connect() as conn:
+        conn = conn.execution_options(stream_results=True)
+        chunks = [
+            _downcast_ids(chunk) for chunk in
+            pd.read_sql(select, conn, params=params, chunksize=chunksize)
+        ]
+        # If there were no results, we still want the (empty) columns.
+        if not chunks:
+            return pd.read_sql(select, conn, params=params)
+    return pd.concat(chunks, ignore_index=True)
+
+
 def fuel(ferc1_meta, ferc1_table, ferc1_years):
     """Creates a DataFrame of f1_fuel table records with plant names, >0 fuel.
 
@@ -667,14 +938,16 @@ def fuel(ferc1_meta, ferc1_table, ferc1_years):
     # Generate a SELECT statement that pulls all fields of the f1_fuel table,
     # but only gets records with plant names and non-zero fuel amounts:
     f1_fuel_select = (
-        sa.sql.select([f1_fuel])
-        .where(f1_fuel.c.fuel != '')
-        .where(f1_fuel.c.fuel_quantity > 0)
-        .where(f1_fuel.c.plant_name != '')
-        .where(f1_fuel.c.report_year.in_(ferc1_years))
+        sa.sql.select(_data_columns(f1_fuel))
+        .where(sa.and_(
+            f1_fuel.c.report_year.in_(REPORT_YEARS),
+            f1_fuel.c.plant_name != '',
+            f1_fuel.c.fuel != '',
+            f1_fuel.c.fuel_quantity > 0,
+        ))
     )
     # Use the above SELECT to pull those records into a DataFrame:
-    return pd.read_sql(f1_fuel_select, ferc1_meta.bind)
+    return _read_ferc1(f1_fuel_select, ferc1_meta.bind, ferc1_years)
 
 
 def plants_steam(ferc1_meta, ferc1_table, ferc1_years):
@@ -698,13 +971,15 @@ def plants_steam(ferc1_meta, ferc1_table, ferc1_years):
     """
     f1_steam = ferc1_meta.tables[ferc1_table]
     f1_steam_select = (
-        sa.sql.select([f1_steam])
-        .where(f1_steam.c.report_year.in_(ferc1_years))
-        .where(f1_steam.c.plant_name != '')
-        .where(f1_steam.c.tot_capacity > 0.0)
+        sa.sql.select(_data_columns(f1_steam))
+        .where(sa.and_(
+            f1_steam.c.report_year.in_(REPORT_YEARS),
+            f1_steam.c.plant_name != '',
+            f1_steam.c.tot_capacity > 0.0,
+        ))
     )
 
-    return pd.read_sql(f1_steam_select, ferc1_meta.bind)
+    return _read_ferc1(f1_steam_select, ferc1_meta.bind, ferc1_years)
 
 
 def plants_small(ferc1_meta, ferc1_table, ferc1_years):
@@ -722,14 +997,13 @@ def plants_small(ferc1_meta, ferc1_table, ferc1_years):
         plant names and non zero demand, generation, operations,
         maintenance, and fuel costs.
     """
-    from sqlalchemy import or_
-
     f1_small = ferc1_meta.tables[ferc1_table]
     f1_small_select = (
-        sa.sql.select([f1_small, ])
-        .where(f1_small.c.report_year.in_(ferc1_years))
-        .where(f1_small.c.plant_name != '')
-        .where(or_((f1_small.c.capacity_rating != 0),
+        sa.sql.select(_data_columns(f1_small))
+        .where(sa.and_(
+            f1_small.c.report_year.in_(REPORT_YEARS),
+            f1_small.c.plant_name != '',
+            sa.or_((f1_small.c.capacity_rating != 0),
                    (f1_small.c.net_demand != 0),
                    (f1_small.c.net_generation != 0),
                    (f1_small.c.plant_cost != 0),
@@ -737,10 +1011,11 @@ def plants_small(ferc1_meta, ferc1_table, ferc1_years):
                    (f1_small.c.operation != 0),
                    (f1_small.c.expns_fuel != 0),
                    (f1_small.c.expns_maint != 0),
-                   (f1_small.c.fuel_cost != 0)))
+                   (f1_small.c.fuel_cost != 0)),
+        ))
     )
 
-    return pd.read_sql(f1_small_select, ferc1_meta.bind)
+    return _read_ferc1(f1_small_select, ferc1_meta.bind, ferc1_years)
 
 
 def plants_hydro(ferc1_meta, ferc1_table, ferc1_years):
@@ -761,12 +1036,14 @@ def plants_hydro(ferc1_meta, ferc1_table, ferc1_years):
     f1_hydro = ferc1_meta.tables[ferc1_table]
 
     f1_hydro_select = (
-        sa.sql.select([f1_hydro])
-        .where(f1_hydro.c.plant_name != '')
-        .where(f1_hydro.c.report_year.in_(ferc1_years))
+        sa.sql.select(_data_columns(f1_hydro))
+        .where(sa.and_(
+            f1_hydro.c.report_year.in_(REPORT_YEARS),
+            f1_hydro.c.plant_name != '',
+        ))
     )
 
-    return pd.read_sql(f1_hydro_select, ferc1_meta.bind)
+    return _read_ferc1(f1_hydro_select, ferc1_meta.bind, ferc1_years)
 
 
 def plants_pumped_storage(ferc1_meta, ferc1_table, ferc1_years):
@@ -789,12 +1066,14 @@ def plants_pumped_storage(ferc1_meta, ferc1_table, ferc1_years):
     # Removing the empty records.
     # This reduces the entries for 2015 from 272 records to 27.
     f1_pumped_storage_select = (
-        sa.sql.select([f1_pumped_storage])
-        .where(f1_pumped_storage.c.plant_name != '')
-        .where(f1_pumped_storage.c.report_year.in_(ferc1_years))
+        sa.sql.select(_data_columns(f1_pumped_storage))
+        .where(sa.and_(
+            f1_pumped_storage.c.report_year.in_(REPORT_YEARS),
+            f1_pumped_storage.c.plant_name != '',
+        ))
     )
 
-    return pd.read_sql(f1_pumped_storage_select, ferc1_meta.bind)
+    return _read_ferc1(f1_pumped_storage_select, ferc1_meta.bind, ferc1_years)
 
 
 def plant_in_service(ferc1_meta, ferc1_table, ferc1_years):
@@ -814,11 +1093,11 @@ def plant_in_service(ferc1_meta, ferc1_table, ferc1_years):
     """
     f1_plant_in_srvce = ferc1_meta.tables[ferc1_table]
     f1_plant_in_srvce_select = (
-        sa.sql.select([f1_plant_in_srvce])
-        .where(f1_plant_in_srvce.c.report_year.in_(ferc1_years))
+        sa.sql.select(_data_columns(f1_plant_in_srvce))
+        .where(f1_plant_in_srvce.c.report_year.in_(REPORT_YEARS))
     )
 
-    return pd.read_sql(f1_plant_in_srvce_select, ferc1_meta.bind)
+    return _read_ferc1(f1_plant_in_srvce_select, ferc1_meta.bind, ferc1_years)
 
 
 def purchased_power(ferc1_meta, ferc1_table, ferc1_years):
@@ -832,17 +1111,28 @@ def purchased_power(ferc1_meta, ferc1_table, ferc1_years):
         ferc1_years (list): The range of years from which to read data.
 
     Returns:
-        pandas.DataFrame: A DataFrame containing all purchased_power_ferc1
-        records.
+        pandas.DataFrame: A DataFrame containing purchased_power_ferc1
+        records that report a non-zero quantity of energy or a non-zero charge.
 
     """
     f1_purchased_pwr = ferc1_meta.tables[ferc1_table]
+    # Records with no energy and no charges carry no useful data, and would
+    # be discarded by the transform step anyway.
     f1_purchased_pwr_select = (
-        sa.sql.select([f1_purchased_pwr])
-        .where(f1_purchased_pwr.c.report_year.in_(ferc1_years))
+        sa.sql.select(_data_columns(f1_purchased_pwr))
+        .where(sa.and_(
+            f1_purchased_pwr.c.report_year.in_(REPORT_YEARS),
+            sa.or_((f1_purchased_pwr.c.mwh_purchased != 0),
+                   (f1_purchased_pwr.c.mwh_recv != 0),
+                   (f1_purchased_pwr.c.mwh_delvd != 0),
+                   (f1_purchased_pwr.c.dmnd_charges != 0),
+                   (f1_purchased_pwr.c.erg_charges != 0),
+                   (f1_purchased_pwr.c.othr_charges != 0),
+                   (f1_purchased_pwr.c.settlement_tot != 0)),
+        ))
     )
 
-    return pd.read_sql(f1_purchased_pwr_select, ferc1_meta.bind)
+    return _read_ferc1(f1_purchased_pwr_select, ferc1_meta.bind, ferc1_years)
 
 
 def accumulated_depreciation(ferc1_meta, ferc1_table, ferc1_years):
@@ -862,11 +1152,24 @@ def accumulated_depreciation(ferc1_meta, ferc1_table, ferc1_years):
     """
     f1_accumdepr_prvsn = ferc1_meta.tables[ferc1_table]
     f1_accumdepr_prvsn_select = (
-        sa.sql.select([f1_accumdepr_prvsn])
-        .where(f1_accumdepr_prvsn.c.report_year.in_(ferc1_years))
+        sa.sql.select(_data_columns(f1_accumdepr_prvsn))
+        .where(f1_accumdepr_prvsn.c.report_year.in_(REPORT_YEARS))
     )
 
-    return pd.read_sql(f1_accumdepr_prvsn_select, ferc1_meta.bind)
+    return _read_ferc1(f1_accumdepr_prvsn_select, ferc1_meta.bind, ferc1_years)
+
+
+# The extract functions for each of the PUDL tables read from FERC Form 1.
+FERC1_EXTRACT_FUNCTIONS = {
+    "fuel_ferc1": fuel,
+    "plants_steam_ferc1": plants_steam,
+    "plants_small_ferc1": plants_small,
+    "plants_hydro_ferc1": plants_hydro,
+    "plants_pumped_storage_ferc1": plants_pumped_storage,
+    "plant_in_service_ferc1": plant_in_service,
+    "purchased_power_ferc1": purchased_power,
+    "accumulated_depreciation_ferc1": accumulated_depreciation
+}
 
 
 ###########################################################################
@@ -894,7 +1197,6 @@ def check_ferc1_tables(refyear):
     tables.remove('f1_respondent_id')
     for table in tables:
         good_years = []
-        print(f"'{table}': [", end="", flush=True)
         for yr in pc.data_years['ferc1']:
             try:
                 pudl.extract.ferc1.init_db(
@@ -905,7 +1207,6 @@ def check_ferc1_tables(refyear):
                     testing=True,
                     force_tables=True)
                 good_years = good_years + [yr, ]
-                print(f"{yr},", end=" ", flush=True)
             # generally bare except: statements are bad, but here we're really
             # just trying to test whether the ferc1 extraction fails for *any*
             # reason, and if not, mark that year as good, thus the # nosec
@@ -914,7 +1215,7 @@ def check_ferc1_tables(refyear):
             ferc1_engine = pudl.extract.ferc1.connect_db(testing=True)
             pudl.extract.ferc1.drop_tables(ferc1_engine)
         good_table_years[table] = good_years
-        print("],", flush=True)
+        logger.info(f"{table} is compatible with {refyear} in: {good_years}")
 
     return good_table_years
 
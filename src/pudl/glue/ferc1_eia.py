@@ -31,6 +31,7 @@ implications of using a co-located set of plant infrastructure as an id.
 
 """
 
+import functools
 import importlib
 import logging
 
@@ -42,39 +43,59 @@ import pudl.constants as pc
 
 logger = logging.getLogger(__name__)
 
+# Column types for each of the tabs in the FERC to EIA mapping spreadsheet.
+MAPPING_CONVERTERS = {
+    'plants_output': {'plant_id_pudl': int,
+                      'plant_name_pudl': str,
+                      'utility_id_ferc1': int,
+                      'utility_name_ferc1': str,
+                      'plant_name_ferc1': str,
+                      'plant_id_eia': int,
+                      'plant_name_eia': str,
+                      'utility_name_eia': str,
+                      'utility_id_eia': int},
+    'utilities_output': {'utility_id_pudl': int,
+                         'utility_name_pudl': str,
+                         'utility_id_ferc1': int,
+                         'utility_name_ferc1': str,
+                         'utility_id_eia': int,
+                         'utility_name_eia': str},
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _read_mapping_sheet(sheet_name):
+    """Read and cache one sheet of the FERC to EIA mapping spreadsheet.
+
+    Parsing the spreadsheet is slow, and several of the functions in this
+    module need the same sheets, so each sheet is only read once per process.
+    The cached dataframes must not be modified -- use the public functions
+    below, which return copies.
 
-def get_plant_map():
-    """Read in the manual FERC to EIA plant mapping data."""
+    Args:
+        sheet_name (str): Either 'plants_output' or 'utilities_output'.
+
+    Returns:
+        pandas.DataFrame: The contents of the spreadsheet tab.
+
+    """
     map_eia_ferc_file = importlib.resources.open_binary(
         'pudl.package_data.glue', 'mapping_eia923_ferc1.xlsx')
 
     return pd.read_excel(
-        map_eia_ferc_file, 'plants_output',
+        map_eia_ferc_file, sheet_name,
         na_values='', keep_default_na=False,
-        converters={'plant_id_pudl': int,
-                    'plant_name_pudl': str,
-                    'utility_id_ferc1': int,
-                    'utility_name_ferc1': str,
-                    'plant_name_ferc1': str,
-                    'plant_id_eia': int,
-                    'plant_name_eia': str,
-                    'utility_name_eia': str,
-                    'utility_id_eia': int})
+        converters=MAPPING_CONVERTERS[sheet_name])
+
+
+def get_plant_map():
+    """Read in the manual FERC to EIA plant mapping data."""
+    return _read_mapping_sheet('plants_output').copy()
 
 
 def get_utility_map():
     """Read in the manual FERC to EIA utility mapping data."""
-    map_eia_ferc_file = importlib.resources.open_binary(
-        'pudl.package_data.glue', 'mapping_eia923_ferc1.xlsx')
-
-    return pd.read_excel(map_eia_ferc_file, 'utilities_output',
-                         na_values='', keep_default_na=False,
-                         converters={'utility_id_pudl': int,
-                                     'utility_name_pudl': str,
-                                     'utility_id_ferc1': int,
-                                     'utility_name_ferc1': str,
-                                     'utility_id_eia': int,
-                                     'utility_name_eia': str})
+    return _read_mapping_sheet('utilities_output').copy()
 
 
 def get_db_plants_ferc1(pudl_settings, years):
@@ -114,7 +135,8 @@ def get_db_plants_ferc1(pudl_settings, years):
                 f"Input year {yr} is not available in the FERC data.")
 
     # Grab the FERC 1 DB metadata so we can query against the DB w/ SQLAlchemy:
-    ferc1_engine = sa.create_engine(pudl_settings["ferc1_db"])
+    ferc1_engine = pudl.extract.ferc1.get_ferc1_engine(
+        pudl_settings["ferc1_db"])
     ferc1_meta = sa.MetaData(bind=ferc1_engine)
     ferc1_meta.reflect()
     ferc1_tables = ferc1_meta.tables
@@ -595,14 +617,14 @@ def glue(ferc1=False, eia=False):
     plants_eia = (
         plant_map.
         loc[:, ['plant_id_eia', 'plant_name_eia', 'plant_id_pudl']].
-        drop_duplicates("plant_id_eia").
-        dropna(subset=["plant_id_eia"])
+        dropna(subset=["plant_id_eia"]).
+        drop_duplicates("plant_id_eia")
     )
     plants_ferc1 = (
         plant_map.
         loc[:, ['plant_name_ferc1', 'utility_id_ferc1', 'plant_id_pudl']].
-        drop_duplicates(['plant_name_ferc1', 'utility_id_ferc1']).
-        dropna(subset=["utility_id_ferc1", "plant_name_ferc1"])
+        dropna(subset=["utility_id_ferc1", "plant_name_ferc1"]).
+        drop_duplicates(['plant_name_ferc1', 'utility_id_ferc1'])
     )
 
     utility_map = get_utility_map()
@@ -613,52 +635,37 @@ def glue(ferc1=False, eia=False):
     utilities_eia = (
         utility_map.
         loc[:, ['utility_id_eia', 'utility_name_eia', 'utility_id_pudl']].
-        drop_duplicates('utility_id_eia').
-        dropna(subset=['utility_id_eia'])
+        dropna(subset=['utility_id_eia']).
+        drop_duplicates('utility_id_eia')
     )
     utilities_ferc1 = (
         utility_map.
         loc[:, ['utility_id_ferc1', 'utility_name_ferc1', 'utility_id_pudl']].
-        drop_duplicates('utility_id_ferc1').
-        dropna(subset=['utility_id_ferc1'])
+        dropna(subset=['utility_id_ferc1']).
+        drop_duplicates('utility_id_ferc1')
     )
 
     # Now we need to create a table that indicates which plants are associated
-    # with every utility.
-
-    # These dataframes map our plant_id to FERC respondents and EIA
-    # operators -- the equivalents of our "utilities"
-    plants_utilities_ferc1 = (
-        plant_map.
-        loc[:, ['plant_id_pudl', 'utility_id_ferc1']].
-        dropna(subset=['utility_id_ferc1'])
-    )
-    plants_utilities_eia = (
-        plant_map.
-        loc[:, ['plant_id_pudl', 'utility_id_eia']].
-        dropna(subset=['utility_id_eia'])
-    )
-
-    # Here we treat the dataframes like database tables, and join on the
-    # FERC respondent_id and EIA operator_id, respectively.
-    # Now we can concatenate the two dataframes, and get rid of all the columns
-    # except for plant_id and utility_id (which determine the  utility to plant
-    # association), and get rid of any duplicates or lingering NaN values...
-    utility_plant_assn = (
-        pd.concat(
-            [pd.merge(utilities_eia,
-                      plants_utilities_eia,
-                      on='utility_id_eia'),
-             pd.merge(utilities_ferc1,
-                      plants_utilities_ferc1,
-                      on='utility_id_ferc1')],
-            sort=True
-        )
-    )
-
+    # with every utility. Here we treat the dataframes like database tables,
+    # and join the plants to our "utilities" on the FERC respondent_id and EIA
+    # operator_id, respectively. Only the ID columns are carried through the
+    # joins, since plant_id and utility_id are all that determine the utility
+    # to plant association. Then we get rid of any duplicates or lingering NaN
+    # values...
+    assn_cols = ['plant_id_pudl', 'utility_id_pudl']
     utility_plant_assn = (
-        utility_plant_assn.
-        loc[:, ['plant_id_pudl', 'utility_id_pudl']].
+        pd.concat([
+            pd.merge(
+                utilities_eia.loc[:, ['utility_id_eia', 'utility_id_pudl']],
+                plant_map.loc[:, ['plant_id_pudl', 'utility_id_eia']].
+                dropna(subset=['utility_id_eia']),
+                on='utility_id_eia').loc[:, assn_cols],
+            pd.merge(
+                utilities_ferc1.loc[:, ['utility_id_ferc1', 'utility_id_pudl']],
+                plant_map.loc[:, ['plant_id_pudl', 'utility_id_ferc1']].
+                dropna(subset=['utility_id_ferc1']),
+                on='utility_id_ferc1').loc[:, assn_cols],
+        ]).
         dropna().
         drop_duplicates()
     )
@@ -673,9 +680,8 @@ def glue(ferc1=False, eia=False):
         [plants_eia, plants_ferc1, utilities_eia, utilities_ferc1],
         ['plants_eia', 'plants_ferc1', 'utilities_eia', 'utilities_ferc1']
     ):
-        if df[pd.isnull(df).any(axis=1)].shape[0] > 1:
+        if df.isnull().any(axis=1).sum() > 1:
             raise AssertionError(f"FERC to EIA glue breaking in {df_n}")
-        df = df.dropna()
 
     # Before we start inserting records into the database, let's do some basic
     # sanity checks to ensure that it's (at least kind of) clean.
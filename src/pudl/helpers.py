@@ -8,10 +8,13 @@ scenarios, it should probably live here. There are lost of transform type
 functions in here that help with cleaning and restructing dataframes.
 """
 
+import csv
+import io
 import logging
 import pathlib
 import re
 import shutil
+import uuid
 from functools import partial
 
 import addfips
@@ -328,6 +331,31 @@ def organize_cols(df, cols):
     return df[organized_cols]
 
 
+def _strip_lower_series(col):
+    """Strip and compact whitespace, and lowercase a Series of strings.
+
+    The values are converted to strings first. Freeform string columns
+    typically contain far fewer distinct values than records, so the string
+    operations are only applied to the unique values, and the results are
+    mapped back onto the whole Series.
+
+    Args:
+        col (pandas.Series): The Series to be cleaned up.
+
+    Returns:
+        pandas.Series: A new Series of cleaned up strings, with the same index.
+
+    """
+    codes, uniques = pd.factorize(col.astype(str))
+    clean = (
+        pd.Series(uniques).
+        str.strip().
+        str.lower().
+        str.replace(r'\s+', ' ')
+    )
+    return pd.Series(clean.to_numpy()[codes], index=col.index, name=col.name)
+
+
 def strip_lower(df, columns):
     """Strip and compact whitespace, lowercase listed DataFrame columns.
 
@@ -348,62 +376,52 @@ def strip_lower(df, columns):
     out_df = df.copy()
     for col in columns:
         if col in out_df.columns:
-            out_df.loc[:, col] = (
-                out_df[col].astype(str).
-                str.strip().
-                str.lower().
-                str.replace(r'\s+', ' ')
-            )
+            out_df.loc[:, col] = _strip_lower_series(out_df[col])
 
     return out_df
 
 
-def cleanstrings_series(col, str_map, unmapped=None, simplify=True):
+def cleanstrings_series(col, inverse_map, unmapped=None, simplify=True):
     """Clean up the strings in a single column/Series.
 
     Args:
         col (pandas.Series): A pandas Series, typically a single column of a
             dataframe, containing the freeform strings that are to be cleaned.
-        map (dict): A dictionary of lists of strings, in which the keys are the
-            simplified canonical strings, witch which each string found in the
-            corresponding list will be replaced.
+        inverse_map (dict): A dictionary whose keys are the strings to be
+            replaced, and whose values are the simplified canonical strings to
+            replace them with. The canonical strings should map to themselves.
+            The inverted string maps in :mod:`pudl.constants` (whose names end
+            in ``_inverse``) are built this way, once, when it's imported.
         unmapped (str): A value with which to replace any string found in col
-            that is not found in one of the lists of strings in map. Typically
-            the null string ''. If None, these strings will not be replaced.
+            that is not found in inverse_map. Typically the null string ''. If
+            None, these strings will not be replaced.
         simplify (bool): If True, strip and compact whitespace, and lowercase
-            all strings in both the list of values to be replaced, and the
-            values found in col. This can reduce the number of strings that
-            need to be kept track of.
+            all strings found in col before they're looked up. In that case
+            the keys of inverse_map must already be simplified the same way,
+            or they will never match.
 
     Returns:
         pandas.Series: The cleaned up Series / column, suitable for
         replacing the original messy column in a :class:`pandas.DataFrame`.
 
+    Raises:
+        TypeError: If inverse_map is an old style string map, whose values
+            are lists of strings, rather than an inverted one.
+
     """
+    if any(isinstance(v, list) for v in inverse_map.values()):
+        raise TypeError(
+            "cleanstrings_series() expects an inverted string map, not a map "
+            "of canonical strings to lists of variants. Use one of the "
+            "*_inverse maps in pudl.constants.")
     if simplify:
-        col = (
-            col.astype(str).
-            str.strip().
-            str.lower().
-            str.replace(r'\s+', ' ')
-        )
-        for k in str_map:
-            str_map[k] = [re.sub(r'\s+', ' ', s.lower().strip())
-                          for s in str_map[k]]
+        col = _strip_lower_series(col)
 
-    for k in str_map:
-        if str_map[k]:
-            col = col.replace(str_map[k], k)
+    mapped = col.map(inverse_map)
 
     if unmapped is not None:
-        badstrings = np.setdiff1d(col.unique(), list(str_map.keys()))
-        # This call to replace can only work if there are actually some
-        # leftover strings to fix -- otherwise it runs forever because we
-        # are replacing nothing with nothing.
-        if len(badstrings) > 0:
-            col = col.replace(badstrings, unmapped)
-
-    return col
+        return mapped.where(mapped.notnull(), unmapped)
+    return mapped.where(mapped.notnull(), col)
 
 
 def cleanstrings(df, columns, stringmaps, unmapped=None, simplify=True):
@@ -425,29 +443,32 @@ def cleanstrings(df, columns, stringmaps, unmapped=None, simplify=True):
             be cleaned up.
         columns (list): a list of string column labels found in the column
             index of df. These are the columns that will be cleaned.
-        stringmaps (list): a list of dictionaries. The keys of these
-            dictionaries are strings, and the values are lists of strings. Each
-            dictionary in the list corresponds to a column in columns. The
-            keys of the dictionaries are the values with which every string in
-            the list of values will be replaced.
+        stringmaps (list): a list of inverted string maps, as described in
+            :func:`cleanstrings_series`, one for each column in columns. The
+            keys of these dictionaries are the strings to be replaced, and the
+            values are the canonical strings with which they will be replaced.
         unmapped (str, None): the value with which strings not found in the
             stringmap dictionary will be replaced. Typically the null string
             ''. If None, then strings found in the columns but not in the
             stringmap will be left unchanged.
         simplify (bool): If true, strip whitespace, remove duplicate
-            whitespace, and force lower-case on both the string map and the
-            values found in the columns to be cleaned. This can reduce the
-            overall number of string values that need to be tracked.
+            whitespace, and force lower-case on the values found in the
+            columns to be cleaned, before they're looked up. This can reduce
+            the overall number of string values that need to be tracked, but
+            the keys of the stringmaps must then be simplified strings too.
 
     Returns:
         pandas.Series: The function returns a new pandas series/column that can
         be used to set the values of the original data.
 
+    Raises:
+        TypeError: If any of the stringmaps isn't an inverted string map.
+
     """
     out_df = df.copy()
-    for col, str_map in zip(columns, stringmaps):
+    for col, inverse_map in zip(columns, stringmaps):
         out_df[col] = cleanstrings_series(
-            out_df[col], str_map, unmapped=unmapped, simplify=simplify)
+            out_df[col], inverse_map, unmapped=unmapped, simplify=simplify)
 
     return out_df
 
@@ -636,18 +657,36 @@ def fix_eia_na(df):
     """
     Replace common ill-posed EIA NA spreadsheet values with np.nan.
 
+    The EIA spreadsheets use a lone period, a single whitespace character, or
+    an empty string to indicate missing values. Only string (object) columns
+    can contain these values, and they're all at most one character long, so
+    rather than matching a regular expression against every cell in the
+    dataframe, we only look at the very short strings in the object columns.
+
     Args:
         df (pandas.DataFrame): The DataFrame to clean.
 
     Returns:
         pandas.DataFrame: The cleaned DataFrame.
 
-    Todo:
-        Update docstring.
-
     """
-    return df.replace(to_replace=[r'^\.$', r'^\s$', r'^$'],
-                      value=np.nan, regex=True)
+    out_df = df.copy()
+    for col in out_df.select_dtypes(include='object').columns:
+        try:
+            lengths = out_df[col].str.len()
+        except AttributeError:
+            # There are no strings in this column at all.
+            continue
+        na_mask = (lengths <= 1).to_numpy()
+        if na_mask.any():
+            na_mask[na_mask] = (
+                out_df.loc[na_mask, col].
+                str.strip().
+                isin(['', '.']).
+                to_numpy()
+            )
+            out_df[col] = out_df[col].mask(na_mask)
+    return out_df.infer_objects()
 
 
 def simplify_columns(df):
@@ -787,6 +826,123 @@ def verify_input_files(ferc1_years,  # noqa: C901
         raise FileNotFoundError("\n".join(err_msg))
 
 
+def _copy_from(table, conn, keys, data_iter):
+    """Load records into PostgreSQL using COPY rather than INSERT.
+
+    This is a ``method`` callable for :meth:`pandas.DataFrame.to_sql`, which
+    writes each chunk of records out as CSV and streams it to the database
+    with ``COPY ... FROM STDIN`` via psycopg2's ``copy_expert()``. It is used
+    by :func:`bulk_load`.
+
+    Args:
+        table (pandas.io.sql.SQLTable): The table being loaded.
+        conn (sqlalchemy.engine.Connection): Connection to the database.
+        keys (list): Names of the columns being loaded.
+        data_iter (iterable): Iterable of records (tuples) to be loaded.
+
+    Returns:
+        None
+
+    """
+    # In CSV format, COPY reads unquoted empty fields as NULL by default, so
+    # empty strings and missing values couldn't be told apart. Missing values
+    # are written as a marker which can't turn up in the data instead.
+    null = f"NULL_{uuid.uuid4().hex}"
+    buf = io.StringIO()
+    csv.writer(buf).writerows(
+        [null if value is None else value for value in row]
+        for row in data_iter)
+    buf.seek(0)
+
+    columns = ', '.join(f'"{k}"' for k in keys)
+    if table.schema:
+        table_name = f'"{table.schema}"."{table.name}"'
+    else:
+        table_name = f'"{table.name}"'
+
+    with conn.connection.cursor() as cur:
+        cur.copy_expert(
+            f"COPY {table_name} ({columns}) FROM STDIN "
+            f"WITH (FORMAT CSV, NULL '{null}')", buf)
+
+
+def bulk_load(df, table, engine, chunksize=10_000):
+    """Append a dataframe to an existing database table in large batches.
+
+    Use this rather than calling :meth:`pandas.DataFrame.to_sql` directly, so
+    that each database backend gets its fastest available loading method.
+    SQLite is fastest when a single prepared ``INSERT`` built from the table
+    definition is handed whole chunks of records via the DBAPI
+    ``executemany()``, without pandas rebuilding the table definition for
+    every call. PostgreSQL can bulk load records much faster with ``COPY``
+    than with any kind of ``INSERT``. For other databases a multi-row
+    ``INSERT`` cuts the number of round trips, and the chunksize is chosen so
+    that each statement stays under 32767 bound parameters.
+
+    Args:
+        df (pandas.DataFrame): The records to be loaded.
+        table (sqlalchemy.Table): The (already created) table to append to.
+            The types of its columns are enforced during loading.
+        engine (sqlalchemy.engine.Engine or sqlalchemy.engine.Connection):
+            Engine or connection to write the records to.
+        chunksize (int): Maximum number of records to write at once. Each
+            chunk of records is boxed into Python objects before it is handed
+            to the database driver, so this bounds the memory that takes,
+            while still being large enough that per-batch overhead is
+            negligible.
+
+    Returns:
+        None
+
+    """
+    if engine.dialect.name == 'sqlite':
+        insert = table.insert()
+        for start in range(0, len(df), chunksize):
+            # Boxing the values as Python objects lets the DBAPI bind them,
+            # and missing values need to be None to become NULLs.
+            chunk = df.iloc[start:start + chunksize].astype(object)
+            engine.execute(insert, chunk.where(chunk.notnull(), None).
+                           to_dict(orient='records'))
+        return
+
+    if engine.dialect.name == 'postgresql':
+        method = _copy_from
+    else:
+        method = 'multi'
+        chunksize = max(1, 32767 // len(df.columns))
+    df.to_sql(table.name, engine, schema=table.schema, index=False,
+              if_exists='append', method=method, chunksize=chunksize,
+              dtype={col.name: col.type for col in table.c})
+
+
+def create_bulk_load_engine(db_url):
+    """Create a database engine tuned for building a database from scratch.
+
+    For SQLite databases, every new connection is set up not to wait for
+    data to be synced to disk after each transaction, and to keep its
+    rollback journal in memory. This makes loading lots of records much
+    faster, at the cost of the database potentially being corrupted if the
+    process dies part way through. That's fine for the databases we build
+    from scratch, since they're rebuilt from the original data anyway.
+
+    Args:
+        db_url (str): An SQLAlchemy database URL.
+
+    Returns:
+        sqlalchemy.engine.Engine: An engine connected to the database.
+
+    """
+    engine = sa.create_engine(db_url)
+    if engine.dialect.name == 'sqlite':
+        @sa.event.listens_for(engine, 'connect')
+        def _set_bulk_load_pragmas(dbapi_conn, connection_record):
+            cursor = dbapi_conn.cursor()
+            cursor.execute("PRAGMA synchronous=OFF")
+            cursor.execute("PRAGMA journal_mode=MEMORY")
+            cursor.close()
+    return engine
+
+
 def drop_tables(engine,
                 clobber=False):
     """Drops all tables from a SQLite database.
@@ -795,9 +951,6 @@ def drop_tables(engine,
     database that the passed in ``engine`` refers to, and uses that schema to
     drop all existing tables.
 
-    Todo:
-        Treat DB connection as a context manager (with/as).
-
     Args:
         engine (sa.engine.Engine): An SQL Alchemy SQLite database Engine
             pointing at an exising SQLite database to be deleted.
@@ -813,9 +966,8 @@ def drop_tables(engine,
         raise AssertionError(
             f'You are attempting to drop your database without setting clobber to {clobber}')
     md.drop_all(engine)
-    conn = engine.connect()
-    conn.execute("VACUUM")
-    conn.close()
+    with engine.connect() as conn:
+        conn.execute("VACUUM")
 
 
 def merge_dicts(list_of_dicts):
@@ -0,0 +1,64 @@
+"""Unit tests for pudl.helpers module."""
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import pudl.helpers as helpers
+
+
+def _reference_fix_eia_na(df):
+    """The original, regular expression based, implementation."""
+    return df.replace(to_replace=[r'^\.$', r'^\s$', r'^$'],
+                      value=np.nan, regex=True)
+
+
+class TestFixEiaNa(unittest.TestCase):
+    """Tests the replacement of EIA spreadsheet NA placeholders."""
+
+    def test_matches_reference(self):
+        """Output, including dtypes, matches the original implementation."""
+        df = pd.DataFrame({
+            'mixed': pd.Series([1.5, '.', 2.0, ' ', ''], dtype=object),
+            'floats': pd.Series([1.5, 2.0, 3.0, 4.0, 5.0], dtype=object),
+            'strings': ['a', '.', 'bc', ' . ', '  '],
+            'ints': [1, 2, 3, 4, 5],
+            'nums': [1.0, np.nan, 3.0, 4.0, 5.0],
+        })
+        expected = _reference_fix_eia_na(df)
+        actual = helpers.fix_eia_na(df)
+        pd.testing.assert_frame_equal(expected, actual)
+        self.assertEqual(np.float64, actual.mixed.dtype)
+        self.assertEqual(np.float64, actual.floats.dtype)
+
+    def test_input_untouched(self):
+        """The input DataFrame isn't modified."""
+        df = pd.DataFrame({'mixed': pd.Series([1.5, '.'], dtype=object)})
+        expected = df.copy()
+        helpers.fix_eia_na(df)
+        pd.testing.assert_frame_equal(expected, df)
+
+
+class TestCleanstrings(unittest.TestCase):
+    """Tests the consolidation of freeform strings."""
+
+    def test_inverse_map(self):
+        """Simplified strings are mapped, and the unmapped ones kept."""
+        col = pd.Series(['  Coal ', 'BIT', 'mystery', np.nan])
+        inverse_map = {'coal': 'coal', 'bit': 'coal'}
+        self.assertListEqual(
+            ['coal', 'coal', 'mystery'],
+            helpers.cleanstrings_series(col, inverse_map)[:3].tolist())
+        self.assertListEqual(
+            ['coal', 'coal', '', ''],
+            helpers.cleanstrings_series(
+                col, inverse_map, unmapped='').tolist())
+
+    def test_old_style_map(self):
+        """Maps of canonical strings to lists of variants are rejected."""
+        col = pd.Series(['coal', 'bit'])
+        with self.assertRaises(TypeError):
+            helpers.cleanstrings_series(col, {'coal': ['coal', 'bit']})
+        with self.assertRaises(TypeError):
+            helpers.cleanstrings(pd.DataFrame({'fuel': col}), ['fuel'],
+                                 [{'coal': ['coal', 'bit']}])
@@ -516,12 +516,12 @@ def _boiler_generator_assn(eia_transformed_dfs,
         return
     # compile and scrub all the parts
     logger.info("Inferring complete EIA boiler-generator associations.")
-    bga_eia860 = (eia_transformed_dfs['boiler_generator_assn_eia860'].copy().
+    bga_eia860 = (eia_transformed_dfs['boiler_generator_assn_eia860'].
                   pipe(_restrict_years, eia923_years, eia860_years).
                   astype({'generator_id': str,
                           'boiler_id': str}))
     # grab the generation_eia923 table, group annually, generate a new tag
-    gen_eia923 = eia_transformed_dfs['generation_eia923'].copy()
+    gen_eia923 = eia_transformed_dfs['generation_eia923']
     gen_eia923 = gen_eia923.set_index(pd.DatetimeIndex(gen_eia923.report_date))
     gen_eia923 = (_restrict_years(gen_eia923, eia923_years, eia860_years).
                   astype({'generator_id': str}).
@@ -531,9 +531,9 @@ def _boiler_generator_assn(eia_transformed_dfs,
     gen_eia923['missing_from_923'] = False
 
     # compile all of the generators
-    gens_eia860 = eia_transformed_dfs['generators_eia860'].copy()
-    gens_eia860 = _restrict_years(gens_eia860, eia923_years, eia860_years)
-    gens_eia860['generator_id'] = gens_eia860.generator_id.astype(str)
+    gens_eia860 = (eia_transformed_dfs['generators_eia860'].
+                   pipe(_restrict_years, eia923_years, eia860_years).
+                   astype({'generator_id': str}))
     gens = pd.merge(gen_eia923, gens_eia860,
                     on=['plant_id_eia', 'report_date', 'generator_id'],
                     how='outer')
@@ -566,11 +566,11 @@ def _boiler_generator_assn(eia_transformed_dfs,
     # apear in gens9 or gens8 (must uncomment-out the og_tag creation above)
     # bga_compiled_1[bga_compiled_1['og_tag'].isnull()]
 
-    bf_eia923 = eia_transformed_dfs['boiler_fuel_eia923'].copy()
-    bf_eia923 = _restrict_years(bf_eia923, eia923_years, eia860_years)
-    bf_eia923['boiler_id'] = bf_eia923.boiler_id.astype(str)
-    bf_eia923['total_heat_content_mmbtu'] = bf_eia923['fuel_consumed_units'] * \
-        bf_eia923['fuel_mmbtu_per_unit']
+    bf_eia923 = (eia_transformed_dfs['boiler_fuel_eia923'].
+                 pipe(_restrict_years, eia923_years, eia860_years).
+                 assign(boiler_id=lambda x: x.boiler_id.astype(str),
+                        total_heat_content_mmbtu=lambda x:
+                        x.fuel_consumed_units * x.fuel_mmbtu_per_unit))
     bf_eia923 = bf_eia923.set_index(pd.DatetimeIndex(bf_eia923.report_date))
     bf_eia923_gb = bf_eia923.groupby(
         [pd.Grouper(freq='AS'), 'plant_id_eia', 'boiler_id'])
@@ -178,19 +178,14 @@ def generators(eia860_dfs, eia860_transformed_dfs):
     ]
 
     for column in boolean_columns_to_fix:
-        gens_df[column] = (
-            gens_df[column]
-            .fillna("NaN")
-            .replace(
-                to_replace=["Y", "N", "NaN"],
-                value=[True, False, pd.NA])
-        )
+        # Anything other than Y/N ends up NA once the column is made boolean.
+        gens_df[column] = gens_df[column].map({"Y": True, "N": False})
 
     gens_df = (
         gens_df.
         pipe(pudl.helpers.month_year_to_date).
         assign(fuel_type_code_pudl=lambda x: pudl.helpers.cleanstrings_series(
-            x['energy_source_code_1'], pc.fuel_type_eia860_simple_map)).
+            x['energy_source_code_1'], pc.fuel_type_eia860_simple_map_inverse)).
         pipe(pudl.helpers.strip_lower,
              columns=['rto_iso_lmp_node_id',
                       'rto_iso_location_wholesale_reporting_id']).
@@ -276,13 +271,8 @@ def plants(eia860_dfs, eia860_transformed_dfs):
     ]
 
     for column in boolean_columns_to_fix:
-        p_df[column] = (
-            p_df[column]
-            .fillna("NaN")
-            .replace(
-                to_replace=["Y", "N", "NaN"],
-                value=[True, False, pd.NA])
-        )
+        # Anything other than Y/N ends up NA once the column is made boolean.
+        p_df[column] = p_df[column].map({"Y": True, "N": False})
 
     # Ensure plant & operator IDs are integers.
     p_df = (
@@ -392,13 +382,8 @@ def utilities(eia860_dfs, eia860_transformed_dfs):
     ]
 
     for column in boolean_columns_to_fix:
-        u_df[column] = (
-            u_df[column]
-            .fillna("NaN")
-            .replace(
-                to_replace=["Y", "N", "NaN"],
-                value=[True, False, pd.NA])
-        )
+        # Anything other than Y/N ends up NA once the column is made boolean.
+        u_df[column] = u_df[column].map({"Y": True, "N": False})
 
     u_df = (
         u_df.astype({"utility_id_eia": int})
@@ -410,6 +395,15 @@ def utilities(eia860_dfs, eia860_transformed_dfs):
     return eia860_transformed_dfs
 
 
+# these are the tables that we have transform functions for...
+EIA860_TRANSFORM_FUNCTIONS = {
+    'ownership_eia860': ownership,
+    'generators_eia860': generators,
+    'plants_eia860': plants,
+    'boiler_generator_assn_eia860': boiler_generator_assn,
+    'utilities_eia860': utilities}
+
+
 def transform(eia860_raw_dfs, eia860_tables=pc.pudl_tables["eia860"]):
     """
     Transforms EIA 860 DataFrames.
@@ -426,25 +420,19 @@ def transform(eia860_raw_dfs, eia860_tables=pc.pudl_tables["eia860"]):
         DataFrame of values from that page (values)
 
     """
-    # these are the tables that we have transform functions for...
-    eia860_transform_functions = {
-        'ownership_eia860': ownership,
-        'generators_eia860': generators,
-        'plants_eia860': plants,
-        'boiler_generator_assn_eia860': boiler_generator_assn,
-        'utilities_eia860': utilities}
     eia860_transformed_dfs = {}
 
     if not eia860_raw_dfs:
         logger.info("No raw EIA 860 dataframes found. "
                     "Not transforming EIA 860.")
         return eia860_transformed_dfs
+    eia860_tables = frozenset(eia860_tables)
     # for each of the tables, run the respective transform funtction
-    for table in eia860_transform_functions:
+    for table in EIA860_TRANSFORM_FUNCTIONS:
         if table in eia860_tables:
             logger.info(f"Transforming raw EIA 860 DataFrames for {table} "
                         f"concatenated across all years.")
-            eia860_transform_functions[table](eia860_raw_dfs,
+            EIA860_TRANSFORM_FUNCTIONS[table](eia860_raw_dfs,
                                               eia860_transformed_dfs)
 
     return eia860_transformed_dfs
@@ -1,6 +1,7 @@
 """Routines specific to cleaning up EIA Form 923 data."""
 
 import logging
+import re
 
 import numpy as np
 import pandas as pd
@@ -40,31 +41,45 @@ def _yearly_to_monthly_records(df, md):
         via df, but with monthly records instead of annual records.
 
     """
-    yearly = df.copy()
-    all_years = pd.DataFrame()
-
-    for y in yearly.report_year.unique():
-        this_year = yearly[yearly.report_year == y].copy()
-        monthly = pd.DataFrame()
-        for m in md:
-            # Grab just the columns for the month we're working on.
-            this_month = this_year.filter(regex=md[m]).copy()
-            # Drop this month's data from the yearly data frame.
-            this_year.drop(this_month.columns, axis=1, inplace=True)
-            # Rename this month's columns to get rid of the month reference.
-            this_month.columns = this_month.columns.str.replace(md[m], '')
-            # Add a numerical month column corresponding to this month.
-            this_month['report_month'] = m
-            # Add this month's data to the monthly DataFrame we're building.
-            monthly = pd.concat([monthly, this_month], sort=True)
-
-        # Merge the monthly data we've built up with the remaining fields in
-        # the data frame we started with -- all of which should be independent
-        # of the month, and apply across all 12 of the monthly records created
-        # from each of the # initial annual records.
-        this_year = this_year.merge(monthly, left_index=True, right_index=True)
-        # Add this new year's worth of data to the big dataframe we'll return
-        all_years = pd.concat([all_years, this_year], sort=True)
+    # Group the records by year, in order of first appearance, without
+    # otherwise disturbing their order.
+    year_codes = pd.factorize(df.report_year)[0]
+    yearly = df.iloc[np.argsort(year_codes, kind='stable')]
+    yearly = yearly[np.sort(year_codes, kind='stable') >= 0]
+
+    # Map each month-specific column to its month and its month-free name.
+    month_cols = {}
+    for m in md:
+        for col in yearly.filter(regex=md[m]).columns:
+            month_cols[col] = (m, re.sub(md[m], '', col))
+    stems = pd.unique([stem for _, stem in month_cols.values()])
+    stem_cols = {stem: {} for stem in stems}
+    for col, (m, stem) in month_cols.items():
+        stem_cols[stem][m] = col
+
+    # Fill each column of the long frame directly: every annual record becomes
+    # len(md) consecutive monthly records, one per month in md. The values are
+    # taken from the underlying arrays, so that extension dtypes are kept.
+    n_months, n_records = len(md), len(yearly)
+    repeated = np.repeat(np.arange(n_records), n_months)
+    interleaved = (np.arange(n_months) * n_records +
+                   np.arange(n_records)[:, None]).ravel()
+    cols = {}
+    for col in yearly.columns.difference(list(month_cols)):
+        cols[col] = yearly[col].array.take(repeated)
+    for stem, by_month in stem_cols.items():
+        stacked = pd.concat(
+            [yearly[by_month[m]] if m in by_month
+             else pd.Series(np.nan, index=yearly.index)
+             for m in md],
+            ignore_index=True)
+        cols[stem] = stacked.array.take(interleaved)
+    cols['report_month'] = np.tile(list(md), n_records)
+
+    all_years = pd.DataFrame(
+        {col: cols[col] for col in sorted(cols)},
+        index=yearly.index.repeat(n_months),
+    )
 
     return all_years
 
@@ -217,9 +232,6 @@ def generation_fuel(eia923_dfs, eia923_transformed_dfs):
         DataFrames of values from that page (values).
 
     """
-    # This needs to be a copy of what we're passed in so we can edit it.
-    gf_df = eia923_dfs['generation_fuel'].copy()
-
     # Drop fields we're not inserting into the generation_fuel_eia923 table.
     cols_to_drop = ['combined_heat_power',
                     'plant_name_eia',
@@ -237,18 +249,20 @@ def generation_fuel(eia923_dfs, eia923_transformed_dfs):
                     'total_fuel_consumption_mmbtu',
                     'elec_fuel_consumption_mmbtu',
                     'net_generation_megawatthours']
-    gf_df.drop(cols_to_drop, axis=1, inplace=True)
+    # This returns a new dataframe, leaving the one we were passed untouched.
+    # Remove "State fuel-level increment" records... which don't pertain to
+    # any particular plant (they have plant_id_eia == operator_id == 99999)
+    # before the records are expanded into 12 monthly records apiece.
+    gf_df = eia923_dfs['generation_fuel'].drop(cols_to_drop, axis=1)
+    gf_df = gf_df[~gf_df.plant_id_eia.isin([99999])]
 
     # Convert the EIA923 DataFrame from yearly to monthly records.
     gf_df = _yearly_to_monthly_records(gf_df, pc.month_dict_eia923)
     # Replace the EIA923 NA value ('.') with a real NA value.
     gf_df = pudl.helpers.fix_eia_na(gf_df)
-    # Remove "State fuel-level increment" records... which don't pertain to
-    # any particular plant (they have plant_id_eia == operator_id == 99999)
-    gf_df = gf_df[gf_df.plant_id_eia != 99999]
 
-    gf_df['fuel_type_code_pudl'] = pudl.helpers.cleanstrings_series(gf_df.fuel_type,
-                                                                    pc.fuel_type_eia923_gen_fuel_simple_map)
+    gf_df['fuel_type_code_pudl'] = pudl.helpers.cleanstrings_series(
+        gf_df.fuel_type, pc.fuel_type_eia923_gen_fuel_simple_map_inverse)
 
     # Convert Year/Month columns into a single Date column...
     gf_df = pudl.helpers.convert_to_date(gf_df)
@@ -275,8 +289,6 @@ def boiler_fuel(eia923_dfs, eia923_transformed_dfs):
         DataFrames of values from that page (values).
 
     """
-    bf_df = eia923_dfs['boiler_fuel'].copy()
-
     # Drop fields we're not inserting into the boiler_fuel_eia923 table.
     cols_to_drop = ['combined_heat_power',
                     'plant_name_eia',
@@ -290,16 +302,18 @@ def boiler_fuel(eia923_dfs, eia923_transformed_dfs):
                     'sector_name',
                     'fuel_unit',
                     'total_fuel_consumption_quantity']
-    bf_df.drop(cols_to_drop, axis=1, inplace=True)
-
-    bf_df.dropna(subset=['boiler_id', 'plant_id_eia'], inplace=True)
+    bf_df = (
+        eia923_dfs['boiler_fuel'].
+        drop(cols_to_drop, axis=1).
+        dropna(subset=['boiler_id', 'plant_id_eia'])
+    )
 
     # Convert the EIA923 DataFrame from yearly to monthly records.
     bf_df = _yearly_to_monthly_records(
         bf_df, pc.month_dict_eia923)
     bf_df['fuel_type_code_pudl'] = pudl.helpers.cleanstrings_series(
         bf_df.fuel_type_code,
-        pc.fuel_type_eia923_boiler_fuel_simple_map)
+        pc.fuel_type_eia923_boiler_fuel_simple_map_inverse)
     # Replace the EIA923 NA value ('.') with a real NA value.
     bf_df = pudl.helpers.fix_eia_na(bf_df)
 
@@ -385,48 +399,23 @@ def coalmine(eia923_dfs, eia923_transformed_dfs):
                      'county_id_fips',
                      'mine_id_msha']
 
-    # Make a copy so we don't alter the FRC data frame... which we'll need
-    # to use again for populating the FRC table (see below)
-    cmi_df = eia923_dfs['fuel_receipts_costs'].copy()
-    # Keep only the columns listed above:
-    cmi_df = _coalmine_cleanup(cmi_df)
-
-    cmi_df = cmi_df[coalmine_cols]
-
-    # If we actually *have* an MSHA ID for a mine, then we have a totally
-    # unique identifier for that mine, and we can safely drop duplicates and
-    # keep just one copy of that mine, no matter how different all the other
-    # fields associated with the mine info are... Here we split out all the
-    # coalmine records that have an MSHA ID, remove them from the CMI
-    # data frame, drop duplicates, and then bring the unique mine records
-    # back into the overall CMI dataframe...
-    cmi_with_msha = cmi_df[cmi_df['mine_id_msha'] > 0]
-    cmi_with_msha = cmi_with_msha.drop_duplicates(subset=['mine_id_msha', ])
-    cmi_df.drop(cmi_df[cmi_df['mine_id_msha'] > 0].index)
-    cmi_df.append(cmi_with_msha)
-
-    cmi_df = cmi_df.drop_duplicates(subset=['mine_name',
-                                            'state',
-                                            'mine_id_msha',
-                                            'mine_type_code',
-                                            'county_id_fips'])
-
-    # drop null values if they occur in vital fields....
-    cmi_df.dropna(subset=['mine_name', 'state'], inplace=True)
-
-    # we need an mine id to associate this coalmine table with the frc
-    # table. In order to do that, we need to create a clean index, like
-    # an autoincremeted id column in a db, which will later be used as a
-    # primary key in the coalmine table and a forigen key in the frc table
-
-    # first we reset the index to get a clean index
-    cmi_df = cmi_df.reset_index()
-    # then we get rid of the old index
-    cmi_df = cmi_df.drop(labels=['index'], axis=1)
-    # then name the index id
-    cmi_df.index.name = 'mine_id_pudl'
-    # then make the id index a column for simpler transferability
-    cmi_df = cmi_df.reset_index()
+    # Only the coalmine columns need cleaning here. Selecting them first
+    # leaves the FRC data frame, which we'll need again for populating the
+    # FRC table (see below), untouched without copying all of it.
+    cmi_df = (
+        eia923_dfs['fuel_receipts_costs'].loc[:, coalmine_cols].
+        pipe(_coalmine_cleanup).
+        drop_duplicates().
+        # drop null values if they occur in vital fields....
+        dropna(subset=['mine_name', 'state']).
+        # we need an mine id to associate this coalmine table with the frc
+        # table. In order to do that, we need to create a clean index, like
+        # an autoincremeted id column in a db, which will later be used as a
+        # primary key in the coalmine table and a forigen key in the frc table
+        reset_index(drop=True).
+        rename_axis('mine_id_pudl').
+        reset_index()
+    )
 
     eia923_transformed_dfs['coalmine_eia923'] = cmi_df
 
@@ -452,8 +441,6 @@ def fuel_receipts_costs(eia923_dfs, eia923_transformed_dfs):
         DataFrames of values from that page (values)
 
     """
-    frc_df = eia923_dfs['fuel_receipts_costs'].copy()
-
     # Drop fields we're not inserting into the fuel_receipts_costs_eia923
     # table.
     cols_to_drop = ['plant_name_eia',
@@ -468,21 +455,15 @@ def fuel_receipts_costs(eia923_dfs, eia923_transformed_dfs):
                     'regulated',
                     'reporting_frequency']
 
-    cmi_df = (
-        eia923_transformed_dfs['coalmine_eia923'].copy()
-        # In order for the merge to work, we need to get the county_id_fips
-        # field back into ready-to-dump form... so it matches the types of the
-        # county_id_fips field that we are going to be merging on in the
-        # frc_df.
-        # rename(columns={'id': 'mine_id_pudl'})
-    )
+    cmi_df = eia923_transformed_dfs['coalmine_eia923']
 
     # This type/naming cleanup function is separated out so that we can be
     # sure it is applied exactly the same both when the coalmine_eia923 table
     # is populated, and here (since we need them to be identical for the
     # following merge)
     frc_df = (
-        frc_df.pipe(_coalmine_cleanup).
+        eia923_dfs['fuel_receipts_costs'].
+        pipe(_coalmine_cleanup).
         merge(cmi_df, how='left',
               on=['mine_name', 'state', 'mine_id_msha',
                   'mine_type_code', 'county_id_fips']).
@@ -499,9 +480,9 @@ def fuel_receipts_costs(eia923_dfs, eia923_transformed_dfs):
             fuel_cost_per_mmbtu=lambda x: x.fuel_cost_per_mmbtu / 100,
             fuel_group_code=lambda x: x.fuel_group_code.str.lower().str.replace(' ', '_'),
             fuel_type_code_pudl=lambda x: pudl.helpers.cleanstrings_series(
-                x.energy_source_code, pc.energy_source_eia_simple_map),
+                x.energy_source_code, pc.energy_source_eia_simple_map_inverse),
             fuel_group_code_simple=lambda x: pudl.helpers.cleanstrings_series(
-                x.fuel_group_code, pc.fuel_group_eia923_simple_map),
+                x.fuel_group_code, pc.fuel_group_eia923_simple_map_inverse),
             contract_expiration_month=lambda x: x.contract_expiration_date.apply(
                 lambda y: y[:-2] if y != '' else y)).
         assign(
@@ -520,8 +501,8 @@ def fuel_receipts_costs(eia923_dfs, eia923_transformed_dfs):
         pipe(pudl.helpers.cleanstrings,
              ['natural_gas_transport_code',
               'natural_gas_delivery_contract_type_code'],
-             [{'firm': ['F'], 'interruptible': ['I']},
-              {'firm': ['F'], 'interruptible': ['I']}],
+             [pc.natural_gas_contract_eia923_strings_inverse,
+              pc.natural_gas_contract_eia923_strings_inverse],
              unmapped='')
     )
 
@@ -535,6 +516,15 @@ def fuel_receipts_costs(eia923_dfs, eia923_transformed_dfs):
     return eia923_transformed_dfs
 
 
+EIA923_TRANSFORM_FUNCTIONS = {
+    'generation_fuel_eia923': generation_fuel,
+    'boiler_fuel_eia923': boiler_fuel,
+    'generation_eia923': generation,
+    'coalmine_eia923': coalmine,
+    'fuel_receipts_costs_eia923': fuel_receipts_costs
+}
+
+
 def transform(eia923_raw_dfs, eia923_tables=pc.eia923_pudl_tables):
     """Transforms all the EIA 923 tables.
 
@@ -551,13 +541,6 @@ def transform(eia923_raw_dfs, eia923_tables=pc.eia923_pudl_tables):
         ready for loading.
 
     """
-    eia923_transform_functions = {
-        'generation_fuel_eia923': generation_fuel,
-        'boiler_fuel_eia923': boiler_fuel,
-        'generation_eia923': generation,
-        'coalmine_eia923': coalmine,
-        'fuel_receipts_costs_eia923': fuel_receipts_costs
-    }
     eia923_transformed_dfs = {}
 
     if not eia923_raw_dfs:
@@ -565,13 +548,15 @@ def transform(eia923_raw_dfs, eia923_tables=pc.eia923_pudl_tables):
                     "Not transforming EIA 923.")
         return eia923_transformed_dfs
 
-    for table in eia923_transform_functions.keys():
+    # Iterate over the transform functions rather than the requested tables,
+    # since fuel_receipts_costs depends on the output of coalmine.
+    eia923_tables = frozenset(eia923_tables)
+    for table, transform_func in EIA923_TRANSFORM_FUNCTIONS.items():
         if table in eia923_tables:
             logger.info(
                 f"Transforming raw EIA 923 DataFrames for {table} "
                 f"concatenated across all years.")
-            eia923_transform_functions[table](eia923_raw_dfs,
-                                              eia923_transformed_dfs)
+            transform_func(eia923_raw_dfs, eia923_transformed_dfs)
         else:
             logger.info(f'Not transforming {table}')
     return eia923_transformed_dfs
@@ -0,0 +1,60 @@
+"""Unit tests for pudl.transform.eia923 module."""
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import pudl.constants as pc
+import pudl.transform.eia923 as eia923
+
+MONTHS = ['january', 'february', 'march', 'april', 'may', 'june', 'july',
+          'august', 'september', 'october', 'november', 'december']
+
+
+def _reference_yearly_to_monthly_records(df, md):
+    """The original, year by year and month by month, implementation."""
+    yearly = df.copy()
+    all_years = pd.DataFrame()
+
+    for y in yearly.report_year.unique():
+        this_year = yearly[yearly.report_year == y].copy()
+        monthly = pd.DataFrame()
+        for m in md:
+            this_month = this_year.filter(regex=md[m]).copy()
+            this_year.drop(this_month.columns, axis=1, inplace=True)
+            this_month.columns = this_month.columns.str.replace(
+                md[m], '', regex=True)
+            this_month['report_month'] = m
+            monthly = pd.concat([monthly, this_month], sort=True)
+        this_year = this_year.merge(monthly, left_index=True, right_index=True)
+        all_years = pd.concat([all_years, this_year], sort=True)
+
+    return all_years
+
+
+class TestYearlyToMonthlyRecords(unittest.TestCase):
+    """Tests the expansion of annual EIA 923 records into monthly records."""
+
+    def test_matches_reference(self):
+        """Output, including dtypes, matches the original implementation."""
+        df = pd.DataFrame({
+            'report_year': [2018, 2017, 2018, 2017],
+            'plant_id_eia': pd.array([1, 2, None, 4], dtype='Int64'),
+            'fuel_type': ['a', None, 'c', 'd'],
+            'capacity_mw': [1.0, np.nan, 3.0, 4.0],
+        }, index=[10, 11, 12, 13])
+        for i, month in enumerate(MONTHS):
+            df[f'net_generation_mwh_{month}'] = [i, np.nan, 2.0 * i, 3.0]
+            df[f'fuel_units_{month}'] = pd.array(
+                [i, None, 3, 4], dtype='Int64')
+            df[f'fuel_code_{month}'] = ['x', None, month, np.nan]
+            # A column family that isn't reported for every month.
+            if i < 6:
+                df[f'quantity_{month}'] = [1.5 * i, 2.0, np.nan, 0.0]
+
+        expected = _reference_yearly_to_monthly_records(
+            df, pc.month_dict_eia923)
+        actual = eia923._yearly_to_monthly_records(df, pc.month_dict_eia923)
+        pd.testing.assert_frame_equal(expected, actual)
+        self.assertEqual(pd.Int64Dtype(), actual.plant_id_eia.dtype)
+        self.assertEqual(pd.Int64Dtype(), actual.fuel_units.dtype)
@@ -32,6 +32,16 @@ import pudl.constants as pc
 
 logger = logging.getLogger(__name__)
 
+# The FERC Form 1 accumulated depreciation line IDs, keyed by row number.
+# This is static reference data, so it only needs to be prepared once.
+FERC1_ACCT_APD_LINE_IDS = dict(
+    pc.ferc_accumulated_depreciation.
+    loc[:, ['row_number', 'line_id']].
+    dropna().
+    astype({'row_number': np.int32}).
+    itertuples(index=False)
+)
+
 ##############################################################################
 # FERC TRANSFORM HELPER FUNCTIONS ############################################
 ##############################################################################
@@ -68,7 +78,7 @@ def unpack_table(ferc1_df, table_name, data_cols, data_rows):
         .copy().transpose()
         .rename_axis(index="year_index", columns=None)
     )
-    row_map.index = row_map.index.astype(int)
+    row_map.index = row_map.index.astype(np.int32)
 
     # For each year, rename row numbers to variable names based on row_map.
     rename_dict = {}
@@ -221,7 +231,7 @@ def _clean_cols(df, table_name):
 
     # Drop any _f columns... since we're not using the FERC Footnotes...
     # Drop columns and don't complain about it if they don't exist:
-    no_f = [c for c in df.columns if not re.match(".*_f$", c)]
+    no_f = [c for c in df.columns if not c.endswith("_f")]
     df = (
         df.loc[:, no_f]
         .drop(['spplmnt_num', 'row_number', 'row_prvlg', 'row_seq',
@@ -365,7 +375,8 @@ def _plants_steam_clean(ferc1_steam_df):
         .pipe(pudl.helpers.strip_lower, ['plant_name_ferc1'])
         .pipe(pudl.helpers.cleanstrings,
               ['construction_type', 'plant_type'],
-              [pc.ferc1_const_type_strings, pc.ferc1_plant_kind_strings],
+              [pc.ferc1_const_type_strings_inverse,
+               pc.ferc1_plant_kind_strings_inverse],
               unmapped='')
         .pipe(pudl.helpers.oob_to_nan,
               cols=["construction_year", "installation_year"],
@@ -581,18 +592,18 @@ def fuel(ferc1_raw_dfs, ferc1_transformed_dfs):
         # map them to some canonical categories... this is necessarily
         # imperfect:
         pipe(pudl.helpers.cleanstrings, ['fuel', 'fuel_unit'],
-             [pc.ferc1_fuel_strings, pc.ferc1_fuel_unit_strings],
+             [pc.ferc1_fuel_strings_inverse,
+              pc.ferc1_fuel_unit_strings_inverse],
              unmapped='').
+        # Convert from BTU/unit of fuel to 1e6 BTU/unit.
+        assign(fuel_avg_mmbtu_per_unit=lambda x: x.fuel_avg_heat / 1e6).
         # Fuel cost per kWh is a per-unit value that doesn't make sense to
         # report for a single fuel that may be only a small part of the fuel
         # consumed. "fuel generaton" is heat rate, but as it's based only on
         # the heat content of a given fuel which may only be a small portion of
         # the overall fuel # consumption, it doesn't make any sense here. Drop
-        # it.
-        drop(['fuel_cost_kwh', 'fuel_generaton'], axis=1).
-        # Convert from BTU/unit of fuel to 1e6 BTU/unit.
-        assign(fuel_avg_mmbtu_per_unit=lambda x: x.fuel_avg_heat / 1e6).
-        drop('fuel_avg_heat', axis=1).
+        # it, along with the heat content we just converted to mmBTU.
+        drop(['fuel_cost_kwh', 'fuel_generaton', 'fuel_avg_heat'], axis=1).
         # Rename the columns to match our DB definitions
         rename(columns={
             # FERC 1 DB Name      PUDL DB Name
@@ -695,12 +706,20 @@ def plants_small(ferc1_raw_dfs, ferc1_transformed_dfs):
     Returns:
         dict: The dictionary of transformed dataframes.
     """
-    # grab table from dictionary of dfs
-    ferc1_small_df = ferc1_raw_dfs['plants_small_ferc1']
-    # Standardize plant_name_raw capitalization and remove leading/trailing
-    # white space -- necesary b/c plant_name_raw is part of many foreign keys.
-    ferc1_small_df = pudl.helpers.strip_lower(
-        ferc1_small_df, ['plant_name', 'kind_of_fuel']
+    # Convert from cents per mmbtu to dollars per mmbtu to be consistent
+    # with the f1_fuel table data. Also, let's use a clearer name. This also
+    # gives us a new dataframe to modify, leaving the raw one untouched.
+    ferc1_small_df = (
+        ferc1_raw_dfs['plants_small_ferc1'].
+        assign(
+            fuel_cost_per_mmbtu=lambda x: x.fuel_cost / 100.0,
+            # Create a single "record number" for the individual lines in the
+            # FERC Form 1 that report different small plants, so that we can
+            # more easily tell whether they are adjacent to each other in the
+            # reporting.
+            record_number=lambda x: 46 * x.spplmnt_num + x.row_number,
+        ).
+        drop('fuel_cost', axis=1)
     )
 
     # Force the construction and installation years to be numeric values, and
@@ -709,17 +728,6 @@ def plants_small(ferc1_raw_dfs, ferc1_transformed_dfs):
         ferc1_small_df, cols=["yr_constructed"],
         lb=1850, ub=max(pc.working_years["ferc1"]) + 1)
 
-    # Convert from cents per mmbtu to dollars per mmbtu to be consistent
-    # with the f1_fuel table data. Also, let's use a clearer name.
-    ferc1_small_df['fuel_cost_per_mmbtu'] = ferc1_small_df['fuel_cost'] / 100.0
-    ferc1_small_df.drop('fuel_cost', axis=1, inplace=True)
-
-    # Create a single "record number" for the individual lines in the FERC
-    # Form 1 that report different small plants, so that we can more easily
-    # tell whether they are adjacent to each other in the reporting.
-    ferc1_small_df['record_number'] = 46 * ferc1_small_df['spplmnt_num'] + \
-        ferc1_small_df['row_number']
-
     # Unforunately the plant types were not able to be parsed automatically
     # in this table. It's been done manually for 2004-2015, and the results
     # get merged in in the following section.
@@ -749,20 +757,23 @@ def plants_small(ferc1_raw_dfs, ferc1_transformed_dfs):
     ferc1_small_df = _clean_cols(ferc1_small_df, 'f1_gnrt_plant')
 
     # Standardize plant_name capitalization and remove leading/trailing white
-    # space, so that plant_name matches formatting of plant_name_raw
+    # space -- necesary b/c plant_name is part of many foreign keys. The
+    # cleaned plant names need the same treatment so they match, but first
+    # the records with no cleaned name need an empty string rather than NaN,
+    # which would otherwise be turned into the string 'nan'.
+    ferc1_small_df['plant_name_clean'] = ferc1_small_df['plant_name_clean'].fillna(
+        value="")
     ferc1_small_df = pudl.helpers.strip_lower(
-        ferc1_small_df, ['plant_name_clean'])
+        ferc1_small_df, ['plant_name', 'kind_of_fuel', 'plant_name_clean'])
 
     # in order to create one complete column of plant names, we have to use the
     # cleaned plant names when available and the orignial plant names when the
-    # cleaned version is not available, but the strings first need cleaning
-    ferc1_small_df['plant_name_clean'] = ferc1_small_df['plant_name_clean'].fillna(
-        value="")
-    ferc1_small_df['plant_name_clean'] = ferc1_small_df.apply(
-        lambda row: row['plant_name']
-        if (row['plant_name_clean'] == "")
-        else row['plant_name_clean'],
-        axis=1)
+    # cleaned version is not available.
+    ferc1_small_df['plant_name_clean'] = (
+        ferc1_small_df['plant_name_clean'].
+        where(ferc1_small_df['plant_name_clean'] != "",
+              ferc1_small_df['plant_name'])
+    )
 
     # now we don't need the uncleaned version anymore
     # ferc1_small_df.drop(['plant_name'], axis=1, inplace=True)
@@ -811,7 +822,7 @@ def plants_hydro(ferc1_raw_dfs, ferc1_transformed_dfs):
         # white space -- necesary b/c plant_name is part of many foreign keys.
         .pipe(pudl.helpers.strip_lower, ['plant_name'])
         .pipe(pudl.helpers.cleanstrings, ['plant_const'],
-              [pc.ferc1_const_type_strings], unmapped='')
+              [pc.ferc1_const_type_strings_inverse], unmapped='')
         .assign(
             # Converting kWh to MWh
             net_generation_mwh=lambda x: x.net_generation / 1000.0,
@@ -896,7 +907,7 @@ def plants_pumped_storage(ferc1_raw_dfs, ferc1_transformed_dfs):
         .pipe(pudl.helpers.strip_lower, ['plant_name'])
         # Clean up the messy plant construction type column:
         .pipe(pudl.helpers.cleanstrings, ['plant_kind'],
-              [pc.ferc1_const_type_strings], unmapped='')
+              [pc.ferc1_const_type_strings_inverse], unmapped='')
         .assign(
             # Converting from kW/kWh to MW/MWh
             net_generation_mwh=lambda x: x.net_generation / 1000.0,
@@ -1125,13 +1136,8 @@ def accumulated_depreciation(ferc1_raw_dfs, ferc1_transformed_dfs):
     # grab table from dictionary of dfs
     ferc1_apd_df = ferc1_raw_dfs['accumulated_depreciation_ferc1']
 
-    ferc1_acct_apd = pc.ferc_accumulated_depreciation.drop(
-        ['ferc_account_description'], axis=1)
-    ferc1_acct_apd.dropna(inplace=True)
-    ferc1_acct_apd['row_number'] = ferc1_acct_apd['row_number'].astype(int)
-
-    ferc1_accumdepr_prvsn_df = pd.merge(ferc1_apd_df, ferc1_acct_apd,
-                                        how='left', on='row_number')
+    ferc1_accumdepr_prvsn_df = ferc1_apd_df.assign(
+        line_id=lambda x: x.row_number.map(FERC1_ACCT_APD_LINE_IDS))
     ferc1_accumdepr_prvsn_df = _clean_cols(
         ferc1_accumdepr_prvsn_df, 'f1_accumdepr_prvsn')
 
@@ -1145,6 +1151,20 @@ def accumulated_depreciation(ferc1_raw_dfs, ferc1_transformed_dfs):
     return ferc1_transformed_dfs
 
 
+FERC1_TRANSFORM_FUNCTIONS = {
+    # fuel must come before steam b/c fuel proportions are used to aid in
+    # plant # ID assignment.
+    'fuel_ferc1': fuel,
+    'plants_steam_ferc1': plants_steam,
+    'plants_small_ferc1': plants_small,
+    'plants_hydro_ferc1': plants_hydro,
+    'plants_pumped_storage_ferc1': plants_pumped_storage,
+    'plant_in_service_ferc1': plant_in_service,
+    'purchased_power_ferc1': purchased_power,
+    'accumulated_depreciation_ferc1': accumulated_depreciation
+}
+
+
 def transform(ferc1_raw_dfs, ferc1_tables=pc.pudl_tables['ferc1']):
     """Transforms FERC 1.
 
@@ -1158,28 +1178,17 @@ def transform(ferc1_raw_dfs, ferc1_tables=pc.pudl_tables['ferc1']):
         dict: A dictionary of the transformed DataFrames.
 
     """
-    ferc1_transform_functions = {
-        # fuel must come before steam b/c fuel proportions are used to aid in
-        # plant # ID assignment.
-        'fuel_ferc1': fuel,
-        'plants_steam_ferc1': plants_steam,
-        'plants_small_ferc1': plants_small,
-        'plants_hydro_ferc1': plants_hydro,
-        'plants_pumped_storage_ferc1': plants_pumped_storage,
-        'plant_in_service_ferc1': plant_in_service,
-        'purchased_power_ferc1': purchased_power,
-        'accumulated_depreciation_ferc1': accumulated_depreciation
-    }
     # create an empty ditctionary to fill up through the transform fuctions
     ferc1_transformed_dfs = {}
 
+    ferc1_tables = frozenset(ferc1_tables)
     # for each ferc table,
-    for table in ferc1_transform_functions:
+    for table in FERC1_TRANSFORM_FUNCTIONS:
         if table in ferc1_tables:
             logger.info(
                 f"Transforming raw FERC Form 1 dataframe for "
                 f"loading into {table}")
-            ferc1_transform_functions[table](ferc1_raw_dfs,
+            FERC1_TRANSFORM_FUNCTIONS[table](ferc1_raw_dfs,
                                              ferc1_transformed_dfs)
 
     # convert types..
@@ -0,0 +1,62 @@
+"""Unit tests for pudl.transform.ferc1 module."""
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+import pudl.transform.ferc1 as ferc1
+
+
+class TestPlantsSmall(unittest.TestCase):
+    """Tests the cleaning of the FERC Form 1 small plant names."""
+
+    def setUp(self):
+        """Builds a small raw plants_small_ferc1 table."""
+        self._raw_df = pd.DataFrame({
+            'report_year': 2015,
+            'report_prd': 12,
+            'respondent_id': 1,
+            'spplmnt_num': 0,
+            'row_number': [1, 2, 3, 4],
+            'plant_name': ['  Big   HYDRO ', 'Small Wind', np.nan, 'NaN'],
+            'kind_of_fuel': [' Water', 'WIND ', np.nan, 'Gas'],
+            'yr_constructed': [1950, 2010, 1990, 1980],
+            'fuel_cost': [0.0, 0.0, 150.0, 250.0],
+        })
+        # Only the first plant has been classified by hand.
+        self._small_types_df = pd.DataFrame({
+            'report_year': [2015],
+            'respondent_id': [1],
+            'record_number': [1],
+            'plant_name_clean': ['Big Hydro Dam '],
+            'plant_type': ['hydro'],
+            'ferc_license': [1234],
+        })
+
+    def _transform(self):
+        raw_dfs = {'plants_small_ferc1': self._raw_df}
+        with patch('pudl.transform.ferc1.pd.read_excel',
+                   return_value=self._small_types_df):
+            return ferc1.plants_small(raw_dfs, {})['plants_small_ferc1']
+
+    def test_plant_names(self):
+        """Hand cleaned names are used, falling back to the reported ones."""
+        small_df = self._transform()
+        self.assertListEqual(
+            ['big hydro dam', 'small wind', 'nan', 'nan'],
+            small_df.plant_name_ferc1.tolist())
+        # The reported names are kept too, cleaned up the same way. Missing
+        # names are stringified, just as they always have been.
+        self.assertListEqual(
+            ['big hydro', 'small wind', 'nan', 'nan'],
+            small_df.plant_name_original.tolist())
+        self.assertListEqual(
+            ['water', 'wind', 'nan', 'gas'],
+            small_df.fuel_type.tolist())
+
+    def test_raw_df_untouched(self):
+        """The raw table isn't modified by the transform."""
+        expected = self._raw_df.copy()
+        self._transform()
+        pd.testing.assert_frame_equal(expected, self._raw_df)